@@ -19,23 +19,90 @@
 
 import os
 import pickle
+import socket
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 import requests
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from datetime import datetime, timezone
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 import config
 
-# Windows-specific imports for file permissions
-try:
-    import win32security
-    import ntsecuritycon as con
-    WINDOWS_SECURITY_AVAILABLE = True
-except ImportError:
-    WINDOWS_SECURITY_AVAILABLE = False
+# Windows-specific modules for file permissions
+# Imported lazily by _load_windows_security() - pywin32 is slow to load and
+# only needed when a token is actually saved
+win32security = None
+con = None
+WINDOWS_SECURITY_AVAILABLE = None  # None = not attempted yet
+
+
+def _load_windows_security():
+    """
+    Imports win32security/ntsecuritycon on first use and caches the result.
+
+    Returns:
+        bool: True if the Windows security modules are available
+    """
+    global win32security, con, WINDOWS_SECURITY_AVAILABLE
+
+    if WINDOWS_SECURITY_AVAILABLE is None:
+        try:
+            import win32security as _win32security
+            import ntsecuritycon as _con
+            win32security, con = _win32security, _con
+            WINDOWS_SECURITY_AVAILABLE = True
+        except ImportError:
+            WINDOWS_SECURITY_AVAILABLE = False
+
+    return WINDOWS_SECURITY_AVAILABLE
+
+
+# Last successful connectivity probe round: (time.monotonic() timestamp, url)
+# Shared process-wide so bursts of checks reuse one answer
+_last_connectivity_success = (None, None)
+
+
+def invalidate_connectivity_cache():
+    """
+    Forgets the last successful connectivity check.
+
+    Call this when a network error shows the cached "online" answer may be
+    wrong, so the next check probes again.
+    """
+    global _last_connectivity_success
+    _last_connectivity_success = (None, None)
+
+
+# YouTube discovery document (JSON text), shared by every AuthManager in the process
+_discovery_document = None
+
+
+def _get_discovery_document():
+    """
+    Returns the YouTube API discovery document as JSON text, reading it once.
+
+    The document ships with google-api-python-client, so this never touches
+    the network; caching the text saves re-reading the file on every client
+    refresh. The text (not a parsed dict) is cached on purpose: the client
+    library modifies the parsed document while building a client, so each
+    build must parse its own copy.
+
+    Returns:
+        str: Discovery document, or None if no static copy is bundled
+    """
+    global _discovery_document
+
+    if _discovery_document is None:
+        _discovery_document = get_static_doc(
+            config.YOUTUBE_API_SERVICE_NAME, config.YOUTUBE_API_VERSION
+        )
+
+    return _discovery_document
 
 
 # ============================================================================
@@ -106,6 +173,10 @@ class AuthManager:
         youtube: Authenticated YouTube API client (googleapiclient Resource)
         playlists (dict): User's playlists {title: id, "No Playlist": None}
     """
+
+    # Windows security lookups are process-stable, so cache them class-wide
+    _cached_user_sid = None
+    _cached_security_descriptor = None
     
     def __init__(self, logger=None):
         """
@@ -118,6 +189,17 @@ class AuthManager:
         self.logger = logger
         self.youtube = None
         self.playlists = {"No Playlist": None}  # Default: no playlist selected
+
+        # hash() of the access token the current client was built with
+        self._creds_token_fingerprint = None
+
+        # Immutable snapshot of playlist titles, rebuilt by fetch_playlists()
+        self._titles_cache = None
+
+        # Shared HTTP session for connectivity probes
+        # Keep-alive lets retries reuse pooled sockets instead of paying a
+        # fresh TCP+TLS handshake on every probe
+        self._probe_session = self._create_probe_session()
         
     def _log(self, message):
         """
@@ -129,10 +211,146 @@ class AuthManager:
         if self.logger:
             self.logger(message)
     
+    def close(self):
+        """
+        Releases network resources held by the AuthManager.
+
+        Closes the pooled connectivity-probe session. Safe to call more than once.
+        """
+        if self._probe_session is not None:
+            self._probe_session.close()
+            self._probe_session = None
+    
     # -------------------------------------------------------------------------
     # Internet Connectivity Check (Required Before Auth)
     # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _create_probe_session():
+        """
+        Creates a requests.Session sized for the connectivity check URLs.
+
+        One pooled connection per probe host is enough, since probes to the
+        same host never overlap.
+
+        Returns:
+            requests.Session: Session with HTTP and HTTPS adapters mounted
+        """
+        pool_size = len(config.CONNECTIVITY_CHECK_URLS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
     
+    def _probe_url(self, url, host, port, is_ip):
+        """
+        Probes a single connectivity URL using config.CONNECTIVITY_PROBE_MODE.
+
+        In 'tcp' mode, IP-literal URLs only need a TCP connect: one round
+        trip, no TLS handshake and no data transferred. Named hosts get an
+        HTTP HEAD (or GET in 'get' mode) after a DNS lookup - a single UDP
+        round trip, so when DNS is down (no network, captive portal) we
+        fail fast instead of letting the request run into its timeout.
+
+        Args:
+            url (str): URL to request
+            host (str): Hostname of the URL
+            port (int): Port of the URL
+            is_ip (bool): True if host is an IP literal
+
+        Returns:
+            bool: True if the URL is reachable
+
+        Raises:
+            OSError: If the connection or request fails
+                     (requests.RequestException is an OSError)
+        """
+        mode = config.CONNECTIVITY_PROBE_MODE
+        timeout = config.CONNECTIVITY_CHECK_TIMEOUT
+
+        if mode == 'tcp' and is_ip:
+            # Connected = reachable; close straight away
+            socket.create_connection((host, port), timeout=timeout).close()
+            return True
+
+        if not is_ip:
+            try:
+                socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            except socket.gaierror:
+                return False
+
+        if mode == 'get':
+            response = self._probe_session.get(url, timeout=timeout)
+            return response.status_code == 200
+
+        # HEAD without following redirects: any 2xx/3xx answer proves the
+        # site is reachable, and no body is transferred
+        response = self._probe_session.head(url, timeout=timeout, allow_redirects=False)
+        return response.status_code < 400
+
+    def _probe_connectivity_urls(self):
+        """
+        Probes every connectivity check URL concurrently.
+
+        Probes are network-bound, so running them in parallel means a round
+        takes at most one CONNECTIVITY_CHECK_TIMEOUT instead of one per URL.
+        Returns as soon as any URL is reachable; probes that have not
+        started yet are cancelled. A success is remembered for
+        CONNECTIVITY_CACHE_TTL_SECONDS, and checks within that window
+        return it without probing.
+
+        The round as a whole is also bounded by that timeout. requests'
+        timeout only limits each connect/read step and DNS lookups have no
+        timeout at all, so without this a stalled probe could hold the
+        round open far longer than CONNECTIVITY_CHECK_TIMEOUT.
+
+        Returns:
+            str: The first URL that responded successfully, or None if all failed
+        """
+        global _last_connectivity_success
+
+        # A recent success is still good - skip the network entirely
+        checked_at, cached_url = _last_connectivity_success
+        if checked_at is not None and time.monotonic() - checked_at < config.CONNECTIVITY_CACHE_TTL_SECONDS:
+            return cached_url
+
+        # Resolve globals/attributes once rather than per probe
+        targets = config.CONNECTIVITY_CHECK_TARGETS
+        probe = self._probe_url
+
+        executor = ThreadPoolExecutor(max_workers=len(targets))
+
+        try:
+            futures = {
+                executor.submit(probe, url, host, port, is_ip): url
+                for url, host, port, is_ip in targets
+            }
+
+            try:
+                for future in as_completed(futures, timeout=config.CONNECTIVITY_CHECK_TIMEOUT):
+                    try:
+                        reachable = future.result()
+                    except OSError:
+                        # This URL failed, wait for the others
+                        continue
+
+                    # If any URL is reachable, we have internet
+                    if reachable:
+                        url = futures[future]
+                        _last_connectivity_success = (time.monotonic(), url)
+                        return url
+            except FuturesTimeoutError:
+                # Remaining probes are stalled; treat the round as failed
+                pass
+
+            return None
+
+        finally:
+            # Don't block on slower probes once we have an answer
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def wait_for_internet(self, max_wait=None, interval=None):
         """
         Waits for stable internet connection before proceeding.
@@ -142,8 +360,8 @@ class AuthManager:
         - Token refresh requires internet
         - VPN connections may take time to establish
         
-        The function tries multiple URLs to avoid false negatives from
-        one service being down or blocked.
+        The function tries multiple URLs (concurrently) to avoid false
+        negatives from one service being down or blocked.
         
         Args:
             max_wait (int, optional): Maximum seconds to wait. Uses config default if None.
@@ -162,40 +380,72 @@ class AuthManager:
         max_wait = max_wait or config.MAX_INTERNET_WAIT_SECONDS
         interval = interval or config.INTERNET_CHECK_INTERVAL_SECONDS
         
-        self._log("Waiting for VPN/Internet connectivity...")
+        # Hoist loop-invariant lookups into locals
+        now = time.time
+        sleep = time.sleep
+        log = self._log
+        probe = self._probe_connectivity_urls
         
-        start_time = time.time()
+        log("Waiting for VPN/Internet connectivity...")
         
-        while time.time() - start_time < max_wait:
-            # Try each URL in our connectivity check list
-            for url in config.CONNECTIVITY_CHECK_URLS:
-                try:
-                    response = requests.get(
-                        url,
-                        timeout=config.CONNECTIVITY_CHECK_TIMEOUT
-                    )
-                    
-                    # If we get a successful response, we have internet
-                    if response.status_code == 200:
-                        self._log(f"Internet connectivity detected via {url}")
-                        return True
-                        
-                except requests.RequestException:
-                    # This URL failed, try the next one
-                    continue
+        start_time = now()
+        
+        while now() - start_time < max_wait:
+            # Probe all URLs at once; the first healthy one wins
+            url = probe()
+            if url:
+                log(f"Internet connectivity detected via {url}")
+                return True
             
             # None of the URLs worked, wait and try again
-            self._log(f"Internet not available yet, retrying in {interval}s...")
-            time.sleep(interval)
+            log(f"Internet not available yet, retrying in {interval}s...")
+            sleep(interval)
         
         # Timeout reached without successful connection
-        self._log(f"Internet not available after {max_wait}s")
+        log(f"Internet not available after {max_wait}s")
         return False
     
     # -------------------------------------------------------------------------
     # Token File Security (Windows Only)
     # -------------------------------------------------------------------------
     
+    @classmethod
+    def _get_owner_only_security_descriptor(cls):
+        """
+        Returns a security descriptor granting FULL_CONTROL to the current user only.
+
+        The SID lookup can contact a domain controller on domain-joined machines,
+        and the resulting DACL is identical for every file, so both are computed
+        once per process and cached on the class.
+
+        Returns:
+            PySECURITY_DESCRIPTOR: Owner-only security descriptor
+        """
+        if cls._cached_security_descriptor is None:
+            # Get current user's SID (Security Identifier)
+            if cls._cached_user_sid is None:
+                cls._cached_user_sid = win32security.LookupAccountName("", os.getlogin())[0]
+
+            # Create a new security descriptor
+            sd = win32security.SECURITY_DESCRIPTOR()
+
+            # Create a DACL (Discretionary Access Control List)
+            dacl = win32security.ACL()
+
+            # Add ACE (Access Control Entry) for current user: FULL_CONTROL
+            dacl.AddAccessAllowedAce(
+                win32security.ACL_REVISION,
+                con.FILE_ALL_ACCESS,
+                cls._cached_user_sid
+            )
+
+            # Set the DACL on the security descriptor
+            sd.SetSecurityDescriptorDacl(1, dacl, 0)
+
+            cls._cached_security_descriptor = sd
+
+        return cls._cached_security_descriptor
+
     def _secure_token_file(self, filepath):
         """
         Sets Windows file permissions to owner-only access.
@@ -213,30 +463,14 @@ class AuthManager:
             This is defense-in-depth. The token.pickle file should already
             be in .gitignore, but this adds protection against local attacks.
         """
-        if not WINDOWS_SECURITY_AVAILABLE:
+        if not _load_windows_security():
             self._log("Warning: Windows security modules not available, "
                      "cannot set restrictive permissions on token file")
             return
         
         try:
-            # Get current user's SID (Security Identifier)
-            user, domain, type = win32security.LookupAccountName("", os.getlogin())
-            
-            # Create a new security descriptor
-            sd = win32security.SECURITY_DESCRIPTOR()
-            
-            # Create a DACL (Discretionary Access Control List)
-            dacl = win32security.ACL()
-            
-            # Add ACE (Access Control Entry) for current user: FULL_CONTROL
-            dacl.AddAccessAllowedAce(
-                win32security.ACL_REVISION,
-                con.FILE_ALL_ACCESS,
-                user
-            )
-            
-            # Set the DACL on the security descriptor
-            sd.SetSecurityDescriptorDacl(1, dacl, 0)
+            # Build (or reuse) the owner-only security descriptor
+            sd = self._get_owner_only_security_descriptor()
             
             # Apply the security descriptor to the file
             win32security.SetFileSecurity(
@@ -264,13 +498,19 @@ class AuthManager:
         Raises:
             AuthenticationError: If token file is corrupted
         """
-        if not os.path.exists(config.TOKEN_FILE):
+        # Open directly instead of checking existence first (one syscall, no race)
+        try:
+            token = open(config.TOKEN_FILE, 'rb')
+        except FileNotFoundError:
             self._log("No existing token file found")
             return None
+        except OSError as e:
+            raise AuthenticationError(f"Could not open token file: {str(e)}")
         
         try:
-            with open(config.TOKEN_FILE, 'rb') as token:
-                creds = pickle.load(token)
+            # Token is tiny - read it in one call and unpickle from memory
+            with token:
+                creds = pickle.loads(token.read())
             
             self._log("Loaded credentials from token.pickle")
             return creds
@@ -290,20 +530,45 @@ class AuthManager:
     def _save_credentials(self, creds):
         """
         Saves OAuth credentials to token.pickle file with secure permissions.
+
+        The token is written atomically:
+        1. Write to a temporary file next to token.pickle
+        2. Flush to disk and restrict its permissions
+        3. Replace token.pickle with the temp file (atomic on NTFS and POSIX)
+
+        A crash mid-write therefore never leaves a corrupted token behind
+        (which would force a browser re-authorization on next start), and the
+        token is never visible under its real name with loose permissions.
         
         Args:
             creds (Credentials): Google OAuth credentials to save
         """
+        temp_path = config.TOKEN_FILE + '.tmp'
+
         try:
-            with open(config.TOKEN_FILE, 'wb') as token:
-                pickle.dump(creds, token)
+            # Serialize in memory with the newest binary protocol, then write once
+            data = pickle.dumps(creds, protocol=pickle.HIGHEST_PROTOCOL)
+            with open(temp_path, 'wb') as token:
+                token.write(data)
+                token.flush()
+                os.fsync(token.fileno())
             
             # Set restrictive file permissions (Windows only)
-            self._secure_token_file(config.TOKEN_FILE)
+            # Done before the rename so the DACL moves with the file
+            self._secure_token_file(temp_path)
+
+            os.replace(temp_path, config.TOKEN_FILE)
             
             self._log("Saved credentials to token.pickle")
             
         except Exception as e:
+            # Clean up temp file if something went wrong
+            try:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+            except OSError:
+                pass
+
             self._log(f"Error saving credentials: {str(e)}")
             raise AuthenticationError(f"Failed to save credentials: {str(e)}")
     
@@ -394,7 +659,86 @@ class AuthManager:
             self._log("YouTube API connection test failed")
             return False
 
-    def initialize_youtube_client(self, force_reauth=False):
+    def _warmup_connection(self):
+        """
+        Cheap reachability check for the YouTube API host.
+
+        Sends an unauthenticated HEAD request through the pooled probe session
+        instead of a full API call, so it costs no quota and no JSON decoding.
+        Used by the periodic refresh, where the credentials were already
+        verified during initialization.
+
+        Returns:
+            bool: True if the API host answered, False otherwise
+        """
+        try:
+            self._probe_session.head(
+                config.YOUTUBE_API_WARMUP_URL,
+                timeout=config.CONNECTIVITY_CHECK_TIMEOUT
+            )
+            return True
+        except requests.RequestException as e:
+            self._log(f"YouTube API host unreachable: {str(e)}")
+            return False
+
+    def _build_client(self, creds):
+        """
+        Builds a YouTube API client from credentials.
+
+        Uses the discovery document bundled with google-api-python-client
+        (static_discovery) so no discovery request is made over the network.
+        The document text is read once per process (see _get_discovery_document);
+        build_from_document() parses a fresh copy for every client, since
+        the library modifies the parsed document.
+        Records a fingerprint of the access token so later refreshes can tell
+        whether the credentials actually changed.
+
+        Args:
+            creds (Credentials): Valid Google OAuth credentials
+
+        Returns:
+            Resource: YouTube API client
+        """
+        discovery_doc = _get_discovery_document()
+
+        if discovery_doc is not None:
+            youtube = build_from_document(discovery_doc, credentials=creds)
+        else:
+            # No bundled document for this API version - let build() handle it
+            youtube = build(
+                config.YOUTUBE_API_SERVICE_NAME,
+                config.YOUTUBE_API_VERSION,
+                credentials=creds,
+                static_discovery=True,
+                cache_discovery=False
+            )
+        self._creds_token_fingerprint = hash(creds.token)
+        return youtube
+
+    @staticmethod
+    def _has_fresh_token(creds):
+        """
+        Checks whether credentials are valid and not close to expiring.
+
+        Credentials.expired only flips right before expiry; this looks at the
+        actual remaining lifetime so callers can skip work while it is large.
+
+        Args:
+            creds (Credentials): Google OAuth credentials
+
+        Returns:
+            bool: True if the token has more than
+                  CREDENTIALS_FRESH_THRESHOLD_SECONDS of lifetime left
+        """
+        if not creds.valid or not creds.expiry:
+            return False
+
+        # google-auth stores expiry as a naive UTC datetime
+        now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+        remaining = (creds.expiry - now_utc).total_seconds()
+        return remaining > config.CREDENTIALS_FRESH_THRESHOLD_SECONDS
+
+    def initialize_youtube_client(self, force_reauth=False, fetch_playlists=True):
         """
         Initializes the YouTube API client with authentication.
 
@@ -404,12 +748,14 @@ class AuthManager:
         3. Refresh if expired
         4. Re-authenticate if necessary
         5. Build YouTube API client
-        6. Test client connection (warm-up)
-        7. Fetch user's playlists
+        6. Test client connection (warm-up, skipped if cached token is still fresh)
+        7. Fetch user's playlists (unless fetch_playlists is False)
 
         Args:
             force_reauth (bool): If True, forces re-authentication even if
                                 token exists. Useful for troubleshooting.
+            fetch_playlists (bool): If False, skip step 7; the caller fetches
+                                    them later with fetch_playlists()
 
         Raises:
             AuthenticationError: If authentication fails
@@ -426,6 +772,9 @@ class AuthManager:
         # Step 2: Get valid credentials
         creds = None
 
+        # Only write token.pickle back if the credentials were refreshed or re-issued
+        creds_dirty = False
+
         if not force_reauth:
             # Try to load existing credentials
             try:
@@ -434,12 +783,19 @@ class AuthManager:
                 # Token was corrupted, need to re-authenticate
                 creds = None
 
+        # A comfortably-live cached token proves the account worked recently,
+        # so the warm-up API call can be skipped on warm restarts
+        skip_connection_test = False
+
         # Step 3: Check if credentials are valid
         if creds:
-            if creds.expired and creds.refresh_token:
+            if self._has_fresh_token(creds):
+                skip_connection_test = True
+            elif creds.expired and creds.refresh_token:
                 # Token expired but we can refresh it
                 try:
                     creds = self._refresh_credentials(creds)
+                    creds_dirty = True
                 except AuthenticationError:
                     # Refresh failed, need to re-authenticate
                     creds = None
@@ -450,30 +806,31 @@ class AuthManager:
         # Step 4: If still no valid credentials, run OAuth flow
         if not creds:
             creds = self._run_oauth_flow()
+            creds_dirty = True
 
-        # Step 5: Save credentials for future use
-        self._save_credentials(creds)
+        # Step 5: Save credentials for future use (skipped if loaded unchanged)
+        if creds_dirty:
+            self._save_credentials(creds)
 
         # Step 6: Build YouTube API client
         try:
-            self.youtube = build(
-                config.YOUTUBE_API_SERVICE_NAME,
-                config.YOUTUBE_API_VERSION,
-                credentials=creds
-            )
+            self.youtube = self._build_client(creds)
             self._log(config.SUCCESS_AUTH)
 
         except Exception as e:
             raise AuthenticationError(f"Failed to build YouTube client: {str(e)}")
 
         # Step 7: Test client connection (warm-up)
-        if not self._test_client_connection():
+        if skip_connection_test:
+            self._log("Cached token still fresh, skipping connection test")
+        elif not self._test_client_connection():
             raise AuthenticationError("Failed to establish connection to YouTube API")
 
         # Step 8: Fetch user's playlists
-        self.fetch_playlists()
+        if fetch_playlists:
+            self.fetch_playlists()
     
-    def refresh_youtube_client(self):
+    def refresh_youtube_client(self, force=False):
         """
         Refreshes the YouTube API client without requiring re-authentication.
 
@@ -485,6 +842,13 @@ class AuthManager:
         - We just rebuild the API client object
         - We re-fetch playlists in case anything changed
 
+        If the stored access token hasn't changed since the client was built
+        and the API host is still reachable, the rebuild and playlist fetch
+        are skipped entirely.
+
+        Args:
+            force (bool): If True, always rebuild the client and re-fetch playlists
+
         Returns:
             bool: True if refresh succeeded, False if refresh failed
 
@@ -499,18 +863,22 @@ class AuthManager:
                 self._log("Warning: No credentials available for refresh")
                 return False
 
+            # Same token as the current client - keep it if it's still healthy
+            if (not force and self.youtube is not None
+                    and hash(creds.token) == self._creds_token_fingerprint):
+                if self._warmup_connection():
+                    self._log("Credentials unchanged, keeping existing YouTube API client")
+                    return True
+                self._log("YouTube API host unreachable, rebuilding client...")
+
             # Rebuild the YouTube API client with same credentials
             try:
-                self.youtube = build(
-                    config.YOUTUBE_API_SERVICE_NAME,
-                    config.YOUTUBE_API_VERSION,
-                    credentials=creds
-                )
+                self.youtube = self._build_client(creds)
             except Exception as e:
                 raise AuthenticationError(f"Failed to rebuild YouTube client: {str(e)}")
 
-            # Test the new client connection
-            if not self._test_client_connection():
+            # Warm up the connection (full API test already ran at initialization)
+            if not self._warmup_connection():
                 raise AuthenticationError("New client connection test failed")
 
             # Re-fetch playlists in case they changed
@@ -548,31 +916,32 @@ class AuthManager:
             return
 
         try:
-            # Start with "No Playlist" option
-            new_playlists = {"No Playlist": None}
+            # Collect raw items from every page, then build the dict once
+            all_items = []
 
             # Pagination loop to fetch all playlists
             next_page_token = None
             page_count = 0
+            list_playlists = self.youtube.playlists().list
+            fields = config.PLAYLIST_LIST_FIELDS
 
             while True:
                 # Request user's playlists
                 # mine=True ensures we only get the current user's playlists
-                request = self.youtube.playlists().list(
+                # fields= trims each page to the only data we read, which keeps
+                # the serial page round trips as small as possible
+                request = list_playlists(
                     part="snippet",
                     mine=True,
                     maxResults=config.MAX_PLAYLISTS_TO_FETCH,
-                    pageToken=next_page_token
+                    pageToken=next_page_token,
+                    fields=fields
                 )
 
                 response = request.execute()
                 page_count += 1
 
-                # Add each playlist from the response
-                for item in response.get("items", []):
-                    playlist_title = item["snippet"]["title"]
-                    playlist_id = item["id"]
-                    new_playlists[playlist_title] = playlist_id
+                all_items.extend(response.get("items", []))
 
                 # Check if there are more pages
                 next_page_token = response.get('nextPageToken')
@@ -581,7 +950,12 @@ class AuthManager:
 
                 self._log(f"Fetching playlists page {page_count + 1}...")
 
-            self.playlists = new_playlists
+            # "No Playlist" option always comes first
+            self.playlists = {
+                "No Playlist": None,
+                **{item["snippet"]["title"]: item["id"] for item in all_items}
+            }
+            self._titles_cache = tuple(self.playlists)
 
             playlist_count = len(self.playlists) - 1  # Don't count "No Playlist"
             self._log(f"Fetched {playlist_count} playlist(s) from YouTube ({page_count} page(s))")
@@ -595,19 +969,24 @@ class AuthManager:
     
     def get_playlist_titles(self):
         """
-        Returns a list of playlist titles for GUI dropdown.
+        Returns the playlist titles for GUI dropdown.
+
+        The tuple is cached and only rebuilt when playlists are re-fetched.
+        Use list(auth.get_playlist_titles()) if a mutable copy is needed.
         
         Returns:
-            list: Playlist titles including "No Playlist"
+            tuple: Playlist titles including "No Playlist"
             
         Example:
             >>> auth = AuthManager()
             >>> auth.initialize_youtube_client()
             >>> titles = auth.get_playlist_titles()
             >>> print(titles)
-            ['No Playlist', 'Gaming Clips', 'Tutorials', 'Vlogs']
+            ('No Playlist', 'Gaming Clips', 'Tutorials', 'Vlogs')
         """
-        return list(self.playlists.keys())
+        if self._titles_cache is None:
+            self._titles_cache = tuple(self.playlists)
+        return self._titles_cache
     
     def get_playlist_id(self, title):
         """
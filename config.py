@@ -8,8 +8,11 @@
 #           files (client_secrets.json, token.pickle) that are gitignored.
 # =============================================================================
 
+import functools
+import ipaddress
 import os
-from pathlib import Path
+import stat
+from urllib.parse import urlsplit
 
 # -----------------------------------------------------------------------------
 # Application Metadata
@@ -29,8 +32,12 @@ CLIENT_SECRETS_FILE = 'client_secrets.json'
 # Generated after first OAuth authorization (stores refresh token)
 TOKEN_FILE = 'token.pickle'
 
-# Tracks MD5 hashes of uploaded files to prevent re-uploads
-# Format: { "md5_hash": { "filename": "video.mp4", "upload_date": "...", "video_id": "..." } }
+# Tracks file hashes of uploaded files to prevent re-uploads
+# Format: { "file_hash": { "filename": "video.mp4", "upload_date": "...", "video_id": "...",
+#                          "hash_algo": "md5", "size": 123, "head_sha256": "..." } }
+# Entries written before hash_algo was recorded are MD5 hashes
+# Entries with a null hash_algo are keyed by "video:<video_id>" instead (the
+# file could not be hashed after upload) and are matched by size/head_sha256
 UPLOAD_HISTORY_FILE = 'upload_history.json'
 
 # Tracks current state of files (pending/uploading/completed/failed)
@@ -46,6 +53,10 @@ QUOTA_STATE_FILE = 'quota_state.json'
 # Format: { "playlist_id": "PLxxx", "sorted_items": [...], "last_position": 42 }
 PLAYLIST_SORT_STATE_FILE = 'playlist_sort_state.json'
 
+# Caches full-file hashes so unchanged files are never hashed twice
+# Format: { "C:\\videos\\video.mp4": [size, mtime_ns, "md5", "hash"] }
+HASH_CACHE_FILE = 'hash_cache.json'
+
 # Stores user preferences (watch folder, privacy, playlist, automation settings)
 # Format: { "last_watch_folder": "C:/Videos", "privacy": "unlisted", ... }
 USER_PREFERENCES_FILE = 'user_preferences.json'
@@ -70,6 +81,11 @@ YOUTUBE_API_VERSION = 'v3'
 # TODO: Implement pagination to fetch all playlists
 MAX_PLAYLISTS_TO_FETCH = 50
 
+# Partial-response mask for playlists().list() when fetching playlist titles
+# Page tokens are only known once the previous page arrives, so pages can't be
+# fetched in parallel - instead we keep each page's payload minimal
+PLAYLIST_LIST_FIELDS = 'nextPageToken,items(id,snippet/title)'
+
 # YouTube video categories
 # See: https://developers.google.com/youtube/v3/docs/videoCategories/list
 # These are the most commonly used categories
@@ -95,6 +111,15 @@ VIDEO_CATEGORIES = {
 # 22 = "People & Blogs" category (safe default)
 DEFAULT_VIDEO_CATEGORY = 'People & Blogs'
 
+# Category names in display order (GUI dropdown), built once
+VIDEO_CATEGORY_NAMES = tuple(VIDEO_CATEGORIES)
+
+# Reverse lookup (category ID -> name) for displaying IDs returned by the API
+VIDEO_CATEGORIES_BY_ID = {category_id: name for name, category_id in VIDEO_CATEGORIES.items()}
+
+# Category ID of the default category, resolved once
+DEFAULT_VIDEO_CATEGORY_ID = VIDEO_CATEGORIES[DEFAULT_VIDEO_CATEGORY]
+
 # -----------------------------------------------------------------------------
 # Quota Management
 # -----------------------------------------------------------------------------
@@ -199,14 +224,63 @@ FALLBACK_TRAY_ICON_COLOR = 'red'
 # We're conservative and only auto-detect the most common formats
 SUPPORTED_VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi')
 
+# Same extensions without the dot, as a set, for O(1) lookups in
+# is_supported_video_file()
+SUPPORTED_VIDEO_EXTENSIONS_SET = frozenset(ext[1:] for ext in SUPPORTED_VIDEO_EXTENSIONS)
+
 # Subfolder name where uploaded files are moved after successful upload
 # This folder is created inside the watch folder
 UPLOADED_FOLDER_NAME = 'Uploaded'
 
-# MD5 hash chunk size (in bytes)
-# We read files in 64KB chunks for efficient memory usage
-# This is the same size used in the original implementation
-MD5_CHUNK_SIZE = 65536  # 64KB
+# Hash algorithm used for duplicate detection ('md5' or 'blake3')
+# MD5 stays the default because existing upload_history.json files are keyed
+# by MD5 digests. 'blake3' needs the optional blake3 package (SIMD, multi-
+# threaded) and falls back to MD5 when the package is not installed.
+# Switching algorithms is safe: history entries record the algorithm used,
+# and legacy MD5 entries are still honoured (see LEGACY_HASH_MAX_FILE_SIZE)
+HASH_ALGORITHM = 'md5'
+
+# File hash chunk size (in bytes)
+# Files are read into a reusable 4MB buffer (one per hashing thread).
+# Videos are hundreds of MB to several GB, and larger chunks mean far fewer
+# read() syscalls and hasher.update() calls - 64x fewer loop iterations
+# than the original 64KB chunks, while memory use stays constant
+HASH_CHUNK_SIZE = 4 * 1024 * 1024  # 4MB
+
+# Skip reading the copy back when moving across drives
+# When True, a copy is fsync'ed and accepted if its size matches the source,
+# instead of being re-read and hashed. Saves a full read of every moved
+# file, but wouldn't notice silent disk corruption - off by default
+TRUST_FILESYSTEM_ON_COPY = False
+
+# Buffer size for copying files into the Uploaded folder (in bytes)
+# The source is hashed chunk by chunk while it is being copied, so it is
+# read only once per move
+COPY_CHUNK_SIZE = 4 * 1024 * 1024  # 4MB
+
+# Bytes hashed from the start of a file for its quick fingerprint
+# History entries store (size, SHA-256 of the first 1MB); a file whose
+# fingerprint matches no entry can't be a duplicate, so its full hash is
+# deferred until after upload instead of delaying the start of the upload
+QUICK_FINGERPRINT_BYTES = 1024 * 1024  # 1MB
+
+# Remember file hashes across scans and restarts (see HASH_CACHE_FILE)
+# An entry is reused only while the file's size and modification time are
+# unchanged, so a re-scan of an unchanged watch folder reads no video data
+ENABLE_HASH_CACHE = True
+
+# Maximum number of files remembered in the hash cache (oldest dropped first)
+HASH_CACHE_MAX_ENTRIES = 5000
+
+# Number of files hashed concurrently when pre-hashing a watch folder batch
+# Hashing releases the GIL, so threads overlap hashing with disk reads.
+# Kept small so spinning disks aren't thrashed by too many parallel readers
+HASH_WORKERS = 4
+
+# Largest file we re-hash with MD5 to match legacy upload_history entries
+# after switching HASH_ALGORITHM away from 'md5'. Bigger files skip the
+# legacy lookup so they don't pay for a second full read
+LEGACY_HASH_MAX_FILE_SIZE = 512 * 1024 * 1024  # 512MB
 
 # Maximum file size for YouTube uploads (in bytes)
 # YouTube's limit is 256GB for most accounts (128GB for unverified)
@@ -214,9 +288,11 @@ MD5_CHUNK_SIZE = 65536  # 64KB
 MAX_FILE_SIZE_BYTES = 256 * 1024 * 1024 * 1024  # 256GB in bytes
 
 # Chunk size for resumable uploads (in bytes)
-# For large files, we upload in chunks to handle network interruptions
-# 10MB chunks provide good balance between reliability and performance
-UPLOAD_CHUNK_SIZE = 10 * 1024 * 1024  # 10MB
+# For large files, we upload in chunks to handle network interruptions.
+# 16MB chunks mean fewer request round trips on fast links while a failed
+# chunk still costs little to resend. Must be a multiple of 256KB.
+# The next chunk is read from disk while the current one uploads
+UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024  # 16MB
 
 # -----------------------------------------------------------------------------
 # Internet Connectivity
@@ -238,9 +314,49 @@ CONNECTIVITY_CHECK_URLS = [
     "https://amazon.com"         # Amazon (almost always up)
 ]
 
+
+def _split_connectivity_url(url):
+    """
+    Splits a connectivity check URL into (url, host, port, is_ip).
+
+    Args:
+        url (str): URL to split
+
+    Returns:
+        tuple: (url, hostname, port, is_ip) with the default port filled in;
+               is_ip is True when the host is an IP literal (no DNS needed)
+    """
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    try:
+        ipaddress.ip_address(parts.hostname)
+        is_ip = True
+    except ValueError:
+        is_ip = False
+    return url, parts.hostname, port, is_ip
+
+
+# CONNECTIVITY_CHECK_URLS parsed once at import: (url, host, port, is_ip)
+# The connectivity checker iterates these directly and never re-parses URLs
+CONNECTIVITY_CHECK_TARGETS = tuple(
+    _split_connectivity_url(url) for url in CONNECTIVITY_CHECK_URLS
+)
+
 # Timeout for each connectivity check request (in seconds)
 CONNECTIVITY_CHECK_TIMEOUT = 5
 
+# How long a successful connectivity check is trusted (in seconds)
+# Checks within this window reuse the last "online" answer instead of
+# probing again; an upload network error discards it immediately
+CONNECTIVITY_CACHE_TTL_SECONDS = 30
+
+# How connectivity check URLs are probed
+# 'tcp'  - IP-literal URLs get a bare TCP connect (one round trip, no TLS,
+#          no data); named hosts get an HTTP HEAD. Cheapest option
+# 'head' - HTTP HEAD for every URL (TLS handshake, but no response body)
+# 'get'  - Full HTTP GET for every URL (original behaviour)
+CONNECTIVITY_PROBE_MODE = 'tcp'
+
 # Maximum time a YouTube API client should be used before refresh (in seconds)
 # Refreshing the client periodically helps prevent stale connections (e.g., VPN IP changes)
 # 1800 seconds = 30 minutes (good balance between refresh frequency and performance)
@@ -256,6 +372,15 @@ CLIENT_REFRESH_UPLOAD_INTERVAL = 50
 # These are temporary issues that recover quickly, so we retry fast instead of exponential backoff
 TRANSIENT_NETWORK_ERROR_RETRY_DELAY_SECONDS = 5
 
+# Endpoint used for the cheap connection warm-up during periodic client refresh
+# Any HTTP response (even 404) proves the API host is reachable
+YOUTUBE_API_WARMUP_URL = "https://www.googleapis.com/"
+
+# Cached OAuth tokens with more than this many seconds of lifetime left are
+# trusted at startup without an extra connection test call
+# 600 seconds = 10 minutes (access tokens normally live for 1 hour)
+CREDENTIALS_FRESH_THRESHOLD_SECONDS = 600
+
 # Timeout for YouTube API connection test call (in seconds)
 # This is used to warm up the connection and catch network issues early
 YOUTUBE_API_TEST_TIMEOUT = 10
@@ -270,11 +395,45 @@ GUI_WINDOW_HEIGHT = 600
 # Log text widget height (in lines)
 GUI_LOG_HEIGHT = 10
 
+# Maximum number of lines kept in the log window
+# Oldest lines are dropped as new ones arrive, so a long-running autonomous
+# session doesn't grow the Tk text buffer forever
+GUI_LOG_MAX_LINES = 2000
+
+# Extra lines the log window may hold before the oldest are trimmed
+# Trimming back to GUI_LOG_MAX_LINES in one go every this many lines is
+# cheaper than deleting a line from the top on every insert
+GUI_LOG_TRIM_LINES = 200
+
+# How often the main thread applies queued UI updates (in milliseconds)
+# Background threads never touch Tk directly; they queue their updates and
+# the main thread drains the queue on this interval (log lines arriving in
+# between are inserted together)
+GUI_UI_QUEUE_POLL_MS = 50
+
+# Most queued UI updates applied per drain
+# A burst beyond this is finished on the next pass, after Tk has handled
+# pending user input, so a flood of log lines can't freeze the window
+GUI_UI_QUEUE_MAX_ITEMS = 500
+
+# Longest time to wait on exit for a running check/upload cycle to stop
+# (in seconds)
+# Exit continues as soon as the cycle stops; this only caps the wait when
+# a cycle is stuck, e.g. in a slow network call
+GUI_QUIT_WAIT_SECONDS = 2.0
+
+# Longest time an upload waits for the playlists to be loaded at startup
+# (in seconds)
+# If they still aren't loaded, the upload goes ahead without a playlist
+GUI_PLAYLIST_WAIT_SECONDS = 30
+
 # System tray icon size (in pixels)
 TRAY_ICON_SIZE = 64
 
 # Timestamp format for log messages
 # Example: "14:30:45: Upload started"
+# Must not be finer than one second: the formatted value is reused for
+# every line logged within the same second
 LOG_TIMESTAMP_FORMAT = '%H:%M:%S'
 
 # Full timestamp format for state files
@@ -284,10 +443,6 @@ STATE_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S'
 # -----------------------------------------------------------------------------
 # Threading and Timing
 # -----------------------------------------------------------------------------
-# Sleep increment for interruptible waits (in seconds)
-# This allows us to check for stop signals frequently during long waits
-SLEEP_INCREMENT_SECONDS = 5
-
 # Polling interval for watch folder checks (in seconds)
 # After completing an upload cycle, we wait this long before checking again
 WATCH_FOLDER_POLL_INTERVAL = 30
@@ -295,12 +450,21 @@ WATCH_FOLDER_POLL_INTERVAL = 30
 # Maximum time to wait for current upload to complete before forcing exit (seconds)
 CLEANUP_TIMEOUT_SECONDS = 5
 
+# Delay before upload_state.json is written after a state change (seconds)
+# Changes made within this window are coalesced into a single atomic write.
+# The 'uploading' state is always written immediately (crash recovery
+# depends on it), and pending writes are flushed on exit
+STATE_WRITE_DEBOUNCE_SECONDS = 0.5
+
 # -----------------------------------------------------------------------------
 # Privacy Settings
 # -----------------------------------------------------------------------------
-# Valid YouTube privacy status values
+# Valid YouTube privacy status values, in display order (GUI dropdown)
 # These are the only values accepted by YouTube API
-PRIVACY_SETTINGS = ['private', 'unlisted', 'public']
+PRIVACY_SETTINGS_ORDER = ('private', 'unlisted', 'public')
+
+# Same values as a set, for O(1) validity checks
+PRIVACY_SETTINGS = frozenset(PRIVACY_SETTINGS_ORDER)
 
 # Default privacy setting for new uploads
 DEFAULT_PRIVACY_SETTING = 'private'
@@ -352,13 +516,46 @@ def validate_config():
         ValueError: If any configuration value is invalid
         FileNotFoundError: If required files are missing
     """
-    # Validate that client_secrets.json exists
-    if not os.path.exists(CLIENT_SECRETS_FILE):
+    # Validate that client_secrets.json exists and is a regular file
+    # (one stat() call answers both questions)
+    try:
+        secrets_stat = os.stat(CLIENT_SECRETS_FILE)
+    except OSError:
+        raise FileNotFoundError(ERROR_NO_CLIENT_SECRETS)
+    if not stat.S_ISREG(secrets_stat.st_mode):
         raise FileNotFoundError(ERROR_NO_CLIENT_SECRETS)
     
-    # Validate MD5 chunk size is positive
-    if MD5_CHUNK_SIZE <= 0:
-        raise ValueError("MD5_CHUNK_SIZE must be positive")
+    # Validate hash chunk size is positive
+    if HASH_CHUNK_SIZE <= 0:
+        raise ValueError("HASH_CHUNK_SIZE must be positive")
+    
+    if HASH_WORKERS <= 0:
+        raise ValueError("HASH_WORKERS must be positive")
+    
+    if GUI_LOG_MAX_LINES <= 0:
+        raise ValueError("GUI_LOG_MAX_LINES must be positive")
+    
+    if GUI_LOG_TRIM_LINES < 0:
+        raise ValueError("GUI_LOG_TRIM_LINES cannot be negative")
+    
+    if GUI_UI_QUEUE_POLL_MS <= 0:
+        raise ValueError("GUI_UI_QUEUE_POLL_MS must be positive")
+    
+    if GUI_UI_QUEUE_MAX_ITEMS <= 0:
+        raise ValueError("GUI_UI_QUEUE_MAX_ITEMS must be positive")
+    
+    if GUI_QUIT_WAIT_SECONDS < 0:
+        raise ValueError("GUI_QUIT_WAIT_SECONDS cannot be negative")
+    
+    if GUI_PLAYLIST_WAIT_SECONDS < 0:
+        raise ValueError("GUI_PLAYLIST_WAIT_SECONDS cannot be negative")
+    
+    if HASH_CACHE_MAX_ENTRIES <= 0:
+        raise ValueError("HASH_CACHE_MAX_ENTRIES must be positive")
+    
+    # Validate hash algorithm
+    if HASH_ALGORITHM not in ('md5', 'blake3'):
+        raise ValueError("HASH_ALGORITHM must be 'md5' or 'blake3'")
     
     # Validate quota cooldown values
     if QUOTA_COOLDOWN_HOURS <= 0:
@@ -366,9 +563,13 @@ def validate_config():
     if QUOTA_COOLDOWN_BUFFER_MINUTES < 0:
         raise ValueError("QUOTA_COOLDOWN_BUFFER_MINUTES cannot be negative")
     
+    # Validate connectivity probe mode
+    if CONNECTIVITY_PROBE_MODE not in ('tcp', 'head', 'get'):
+        raise ValueError("CONNECTIVITY_PROBE_MODE must be 'tcp', 'head' or 'get'")
+    
     # Validate privacy settings
     if DEFAULT_PRIVACY_SETTING not in PRIVACY_SETTINGS:
-        raise ValueError(f"DEFAULT_PRIVACY_SETTING must be one of {PRIVACY_SETTINGS}")
+        raise ValueError(f"DEFAULT_PRIVACY_SETTING must be one of {PRIVACY_SETTINGS_ORDER}")
     
     # Validate video extensions are lowercase and start with dot
     for ext in SUPPORTED_VIDEO_EXTENSIONS:
@@ -384,10 +585,14 @@ def validate_config():
 # Helper Functions
 # -----------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=8)
 def get_uploaded_folder_path(watch_folder):
     """
     Returns the full path to the 'Uploaded' subfolder within the watch folder.
     
+    The result is cached: the watch folder rarely changes during a session,
+    so repeated calls (once per uploaded file) skip os.path.join.
+    
     Args:
         watch_folder (str): Path to the watch folder
         
@@ -417,7 +622,16 @@ def is_supported_video_file(filename):
         >>> is_supported_video_file("document.pdf")
         False
     """
-    return filename.lower().endswith(SUPPORTED_VIDEO_EXTENSIONS)
+    # Only the extension is lowercased, not the whole filename.
+    # rpartition is a single C call (cheaper than os.path.splitext);
+    # a name without any dot has no extension at all
+    _, dot, extension = filename.rpartition('.')
+    return bool(dot) and extension.lower() in SUPPORTED_VIDEO_EXTENSIONS_SET
+
+
+# Units and divisors for format_file_size(), indexed by power of 1024
+_FILE_SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
+_FILE_SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(_FILE_SIZE_UNITS)))
 
 
 def format_file_size(size_bytes):
@@ -438,9 +652,7 @@ def format_file_size(size_bytes):
     """
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 ** 2:
-        return f"{size_bytes / 1024:.2f} KB"
-    elif size_bytes < 1024 ** 3:
-        return f"{size_bytes / (1024 ** 2):.2f} MB"
-    else:
-        return f"{size_bytes / (1024 ** 3):.2f} GB"
+
+    # (bit_length() - 1) // 10 is the power of 1024 (1 = KB, 2 = MB, 3+ = GB)
+    unit_index = min((int(size_bytes).bit_length() - 1) // 10, 3)
+    return f"{size_bytes / _FILE_SIZE_DIVISORS[unit_index]:.2f} {_FILE_SIZE_UNITS[unit_index]}"
@@ -16,13 +16,18 @@
 # - Windows startup integration
 #
 # Threading Model:
-# - GUI runs on main thread
-# - Upload/monitoring runs on background thread
-# - All GUI updates use thread-safe methods
+# - GUI runs on main thread, which also schedules the watch folder checks
+#   (root.after)
+# - Folder checks, uploads and playlist fetches/sorts run one at a time on
+#   a single long-lived background job thread (_run_background_jobs)
+# - Background threads queue their GUI updates (_run_on_ui)
 # =============================================================================
 
 import tkinter as tk
 from tkinter import ttk
+import collections
+import functools
+import queue
 import threading
 import time
 import sys
@@ -35,7 +40,77 @@ from dialog_manager import DialogManager
 from window_manager import WindowManager
 from system_tray_manager import SystemTrayManager
 from windows_integration import WindowsIntegration
-from gui_components import TooltipHelper
+from gui_components import TooltipManager, get_app_icon
+from upload_manager import QuotaExceededError
+
+
+def _is_quota_error(error):
+    """
+    Checks whether an upload error means the YouTube API quota is exhausted.
+
+    Args:
+        error (Exception): Error raised by an upload
+
+    Returns:
+        bool: True for QuotaExceededError, or an API error reporting quotaExceeded
+    """
+    return isinstance(error, QuotaExceededError) or "quotaExceeded" in str(error)
+
+
+def _format_log_lines(entries):
+    """
+    Builds log window text from queued log entries.
+
+    Messages logged with arguments are %-formatted here, when the lines are
+    inserted, so lines dropped while the window is hidden are never formatted.
+
+    Args:
+        entries (iterable): (timestamp, message, args) tuples queued by GUI.log()
+
+    Returns:
+        str: One timestamped line per entry
+    """
+    lines = []
+    for timestamp, message, args in entries:
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+        lines.append(f"{timestamp}: {message}\n")
+    return ''.join(lines)
+
+
+# Automation and toast notification preferences: (preference key, default)
+# Each is held in a BooleanVar named '<preference key>_var'
+_BOOLEAN_PREFERENCES = (
+    ('autonomous_mode', config.DEFAULT_AUTONOMOUS_MODE),
+    ('auto_start_watching', config.DEFAULT_AUTO_START_WATCHING),
+    ('start_minimized', config.DEFAULT_START_MINIMIZED),
+    ('notify_when_empty', config.DEFAULT_NOTIFY_WHEN_EMPTY),
+    ('start_with_windows', False),
+    ('notify_upload_success', config.DEFAULT_NOTIFY_UPLOAD_SUCCESS),
+    ('notify_upload_failed', config.DEFAULT_NOTIFY_UPLOAD_FAILED),
+    ('notify_quota_exceeded', config.DEFAULT_NOTIFY_QUOTA_EXCEEDED),
+    ('notify_batch_complete', config.DEFAULT_NOTIFY_BATCH_COMPLETE),
+)
+
+# Toast notification checkboxes: (preference key, label, tooltip)
+# Each checkbox is bound to the BooleanVar named '<preference key>_var'
+_TOAST_PREFERENCES = (
+    ('notify_upload_success', "Upload succeeded",
+     "Show notification when a video uploads successfully\n"
+     "Good for monitoring progress when minimized"),
+    ('notify_upload_failed', "Upload failed",
+     "Show notification when a video upload fails\n"
+     "Alerts you to errors that need attention"),
+    ('notify_quota_exceeded', "Quota exceeded",
+     "Show notification when YouTube API quota is exceeded\n"
+     "Lets you know uploads will resume in 24 hours"),
+    ('notify_batch_complete', "Batch complete",
+     "Show notification when all videos in batch are uploaded\n"
+     "Useful for knowing when a large batch finishes"),
+)
 
 
 class YouTubeUploaderGUI:
@@ -45,7 +120,7 @@ class YouTubeUploaderGUI:
     This class manages:
     - Tkinter window and widgets
     - System tray icon
-    - Background worker thread
+    - Watch folder scheduling and check/upload threads
     - Event handlers for user actions
     
     Attributes:
@@ -55,6 +130,67 @@ class YouTubeUploaderGUI:
         state_manager: StateManager instance
         upload_manager: UploadManager instance
     """
+
+    # Fixed attribute set: no per-instance __dict__, faster attribute access.
+    # Every attribute assigned on self must be listed here
+    __slots__ = (
+        'auth_manager',
+        'file_handler',
+        'state_manager',
+        'upload_manager',
+        'stop_event',
+        'watch_folder',
+        '_bg_jobs',
+        '_bg_idle',
+        '_watch_after_id',
+        'root',
+        '_ui_queue',
+        '_pending_log_lines',
+        '_progress_lock',
+        '_pending_progress',
+        '_shown_percent',
+        '_log_timestamp',
+        '_playlists_loaded',
+        '_playlist_titles',
+        'notification_manager',
+        'dialog_manager',
+        'windows_integration',
+        'system_tray_manager',
+        'window_manager',
+        'tooltip_manager',
+        'folder_path_var',
+        'privacy_var',
+        'privacy_combo',
+        'playlist_var',
+        'playlist_combo',
+        'sort_playlist_button',
+        'category_var',
+        'category_combo',
+        'autonomous_mode_var',
+        'auto_start_watching_var',
+        'start_minimized_var',
+        'notify_when_empty_var',
+        'start_with_windows_var',
+        'notify_upload_success_var',
+        'notify_upload_failed_var',
+        'notify_quota_exceeded_var',
+        'notify_batch_complete_var',
+        '_notify_flags',
+        'automation_toggle_button',
+        'automation_content_frame',
+        '_automation_built',
+        'next_check_var',
+        'progress_var',
+        'progress_bar',
+        'start_button',
+        'stop_button',
+        'force_check_button',
+        'upload_file_button',
+        'exit_button',
+        'log_text',
+        'status_var',
+        'status_bar',
+    )
     
     def __init__(self, auth_manager, file_handler, state_manager, upload_manager):
         """
@@ -73,16 +209,55 @@ class YouTubeUploaderGUI:
         self.upload_manager = upload_manager
 
         # Thread control flags
-        self.should_stop = False
+        # stop_event tells a running check/upload cycle to stop between uploads
+        self.stop_event = threading.Event()
 
         # Watch folder path
         self.watch_folder = ""
 
+        # Pending root.after() id of the next scheduled check while watching
+        self._watch_after_id = None
+
+        # Uploads, folder checks and playlist fetches/sorts run one at a
+        # time, in order, on a single background thread (see
+        # _run_background_jobs), so they never call the YouTube API
+        # concurrently
+        self._bg_jobs = queue.Queue()
+        self._bg_idle = threading.Event()
+        self._bg_idle.set()
+        threading.Thread(target=self._run_background_jobs, daemon=True).start()
+
+        # UI updates queued by background threads (applied on the main thread)
+        self._ui_queue = queue.Queue()
+
+        # Log lines not yet inserted into the log window (held back while
+        # the window is hidden in the tray; the window only keeps the
+        # newest GUI_LOG_MAX_LINES anyway)
+        self._pending_log_lines = collections.deque(maxlen=config.GUI_LOG_MAX_LINES)
+
+        # Latest (percent, status) from _set_progress() not yet applied, and
+        # the whole percent the progress bar currently shows
+        self._progress_lock = threading.Lock()
+        self._pending_progress = None
+        self._shown_percent = 0
+
+        # (epoch second, formatted timestamp) of the last log line
+        self._log_timestamp = (None, '')
+
+        # Set once the playlists have been fetched and the selection resolved
+        self._playlists_loaded = threading.Event()
+        self._playlist_titles = None
+
         # Create main window
         self.root = tk.Tk()
         self.root.title(f"{config.APP_NAME} v{config.APP_VERSION}")
         self.root.geometry(f"{config.GUI_WINDOW_WIDTH}x{config.GUI_WINDOW_HEIGHT}")
 
+        # Keep the window unmapped while it's being built, so Tk lays it out
+        # once when shown instead of after every widget is packed
+        # (shown by _apply_automation_preferences)
+        self.root.withdraw()
+
         # Set window icon if available
         self._set_window_icon()
 
@@ -109,6 +284,7 @@ class YouTubeUploaderGUI:
         self.root.protocol("WM_DELETE_WINDOW", self.window_manager.minimize_to_tray)
 
         # Build GUI components
+        self.tooltip_manager = TooltipManager(self.root)
         self._setup_gui_components()
 
         # Setup system tray icon
@@ -120,14 +296,17 @@ class YouTubeUploaderGUI:
         # Check for incomplete uploads from previous session
         self._check_incomplete_uploads()
 
-        # Populate playlist dropdown from auth_manager
-        self._populate_playlist_dropdown()
-
         # Load user preferences and apply them
         self._load_preferences()
 
+        # Fetch playlists in the background and fill the dropdown when done
+        self._populate_playlist_dropdown()
+
         # Apply automation settings from preferences
         self._apply_automation_preferences()
+
+        # Start applying queued UI updates
+        self.root.after(config.GUI_UI_QUEUE_POLL_MS, self._drain_ui_queue)
     
     # -------------------------------------------------------------------------
     # Icon Setup
@@ -142,15 +321,13 @@ class YouTubeUploaderGUI:
         """
         try:
             icon_path = config.ICON_PATH
-            if os.path.exists(icon_path):
-                # Load icon as PhotoImage for tkinter
-                icon_image = tk.PhotoImage(file=icon_path)
-                self.root.iconphoto(True, icon_image)
-                # Keep a reference to prevent garbage collection
-                self.root.icon_image = icon_image
-                self.log(f"Loaded window icon from {icon_path}")
-            else:
-                self.log(f"Icon file not found at {icon_path}, using default")
+            # Shared decoded icon (cached in gui_components, which also
+            # keeps the reference that prevents garbage collection).
+            # default=True applies it to every later Toplevel as well
+            self.root.iconphoto(True, get_app_icon(icon_path))
+            self.log(f"Loaded window icon from {icon_path}")
+        except FileNotFoundError:
+            self.log(f"Icon file not found at {icon_path}, using default")
         except Exception as e:
             self.log(f"Could not load window icon: {str(e)}")
 
@@ -173,8 +350,8 @@ class YouTubeUploaderGUI:
 
         All controls include tooltips for user guidance.
         """
-        # Use TooltipHelper for creating tooltips
-        create_tooltip = TooltipHelper.create_tooltip
+        # All tooltips share one delegated binding (see TooltipManager)
+        create_tooltip = self.tooltip_manager.add
 
         # ===================
         # Watch Folder Frame
@@ -186,7 +363,7 @@ class YouTubeUploaderGUI:
         folder_label.pack(side=tk.LEFT)
         create_tooltip(folder_label, "The folder to monitor for new videos to upload")
 
-        self.folder_path_var = tk.StringVar()
+        self.folder_path_var = tk.StringVar(self.root)
         folder_entry = ttk.Entry(
             folder_frame,
             textvariable=self.folder_path_var
@@ -212,11 +389,11 @@ class YouTubeUploaderGUI:
         privacy_label.pack(side=tk.LEFT)
         create_tooltip(privacy_label, "Who can see your uploaded videos")
 
-        self.privacy_var = tk.StringVar(value=config.DEFAULT_PRIVACY_SETTING)
+        self.privacy_var = tk.StringVar(self.root, value=config.DEFAULT_PRIVACY_SETTING)
         self.privacy_combo = ttk.Combobox(
             privacy_frame,
             textvariable=self.privacy_var,
-            values=config.PRIVACY_SETTINGS,
+            values=config.PRIVACY_SETTINGS_ORDER,
             state="readonly",
             width=15
         )
@@ -241,11 +418,11 @@ class YouTubeUploaderGUI:
         playlist_label.pack(side=tk.LEFT)
         create_tooltip(playlist_label, "Automatically add uploaded videos to this playlist")
 
-        self.playlist_var = tk.StringVar(value="No Playlist")
+        self.playlist_var = tk.StringVar(self.root, value="No Playlist")
         self.playlist_combo = ttk.Combobox(
             playlist_frame,
             textvariable=self.playlist_var,
-            values=["No Playlist"],  # Will be populated after auth
+            values=("No Playlist",),  # Will be populated after auth
             state="readonly",
             width=25
         )
@@ -283,11 +460,11 @@ class YouTubeUploaderGUI:
         category_label.pack(side=tk.LEFT)
         create_tooltip(category_label, "YouTube category for uploaded videos")
 
-        self.category_var = tk.StringVar(value=config.DEFAULT_VIDEO_CATEGORY)
+        self.category_var = tk.StringVar(self.root, value=config.DEFAULT_VIDEO_CATEGORY)
         self.category_combo = ttk.Combobox(
             category_frame,
             textvariable=self.category_var,
-            values=list(config.VIDEO_CATEGORIES.keys()),
+            values=config.VIDEO_CATEGORY_NAMES,
             state="readonly",
             width=20
         )
@@ -308,169 +485,33 @@ class YouTubeUploaderGUI:
         automation_frame.pack(fill=tk.X, padx=5, pady=5)
         create_tooltip(automation_frame, "Configure automatic behavior and Windows integration")
 
-        # Use grid layout with 3 columns for better organization
-        # Column 0: Automation controls
-        # Column 1: Windows integration
-        # Column 2: Toast notifications
-
-        # Autonomous mode checkbox
-        self.autonomous_mode_var = tk.BooleanVar(value=config.DEFAULT_AUTONOMOUS_MODE)
-        autonomous_check = ttk.Checkbutton(
+        # The settings variables are created now (cheap) so preferences can
+        # be loaded and applied; the checkbox widgets themselves are only
+        # built the first time the panel is expanded
+        # (explicit master: skips tkinter's default-root lookup per variable)
+        for key, default in _BOOLEAN_PREFERENCES:
+            setattr(self, f'{key}_var', tk.BooleanVar(self.root, value=default))
+
+        # Plain-bool copies of the notification settings for the background
+        # threads (Tk variables may only be read on the main thread), kept
+        # in sync by a write trace on each variable
+        self._notify_flags = {}
+        for key, default in _BOOLEAN_PREFERENCES:
+            if key.startswith('notify_'):
+                self._notify_flags[key] = default
+                getattr(self, f'{key}_var').trace_add(
+                    'write', functools.partial(self._sync_notify_flag, key))
+
+        self.automation_toggle_button = ttk.Button(
             automation_frame,
-            text="Autonomous Mode (set and forget)",
-            variable=self.autonomous_mode_var,
-            command=self._on_autonomous_mode_changed
-        )
-        autonomous_check.grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
-        create_tooltip(
-            autonomous_check,
-            "Enable fully autonomous operation:\n"
-            "- Auto-start watching on app launch\n"
-            "- Start minimized to tray\n"
-            "- No manual intervention required"
+            text="Show Automation Settings",
+            command=self._on_toggle_automation_panel
         )
+        self.automation_toggle_button.pack(anchor=tk.W, padx=5, pady=2)
 
-        # Auto-start watching checkbox
-        self.auto_start_watching_var = tk.BooleanVar(value=config.DEFAULT_AUTO_START_WATCHING)
-        auto_start_check = ttk.Checkbutton(
-            automation_frame,
-            text="Auto-start watching on launch",
-            variable=self.auto_start_watching_var,
-            command=self._on_auto_start_watching_changed
-        )
-        auto_start_check.grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
-        create_tooltip(
-            auto_start_check,
-            "Automatically begin monitoring the watch folder when app starts\n"
-            "No need to click 'Start Watching' button manually"
-        )
-
-        # Start minimized checkbox
-        self.start_minimized_var = tk.BooleanVar(value=config.DEFAULT_START_MINIMIZED)
-        start_minimized_check = ttk.Checkbutton(
-            automation_frame,
-            text="Start minimized to tray",
-            variable=self.start_minimized_var,
-            command=self._on_start_minimized_changed
-        )
-        start_minimized_check.grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
-        create_tooltip(
-            start_minimized_check,
-            "Start the app minimized to system tray instead of showing window\n"
-            "Useful for running silently in the background"
-        )
-
-        # Notify when empty checkbox
-        self.notify_when_empty_var = tk.BooleanVar(value=config.DEFAULT_NOTIFY_WHEN_EMPTY)
-        notify_empty_check = ttk.Checkbutton(
-            automation_frame,
-            text="Notify when folder is empty",
-            variable=self.notify_when_empty_var,
-            command=self._on_notify_when_empty_changed
-        )
-        notify_empty_check.grid(row=0, column=1, sticky=tk.W, padx=5, pady=2)
-        create_tooltip(
-            notify_empty_check,
-            "Show Windows notification when all videos have been uploaded\n"
-            "Lets you know when you can add more videos"
-        )
-
-        # Start with Windows checkbox
-        self.start_with_windows_var = tk.BooleanVar(value=False)
-        start_with_windows_check = ttk.Checkbutton(
-            automation_frame,
-            text="Start with Windows",
-            variable=self.start_with_windows_var,
-            command=self._on_start_with_windows_changed
-        )
-        start_with_windows_check.grid(row=1, column=1, sticky=tk.W, padx=5, pady=2)
-        create_tooltip(
-            start_with_windows_check,
-            "Add YouTube Uploader to Windows startup folder\n"
-            "App will launch automatically when Windows starts\n"
-            "(Requires restart to take effect)"
-        )
-
-        if not self.windows_integration.is_startup_available():
-            start_with_windows_check.config(state=tk.DISABLED)
-            create_tooltip(
-                start_with_windows_check,
-                "Windows startup integration not available\n"
-                "(Requires pywin32 and winshell packages)"
-            )
-
-        # ===================
-        # Toast Notifications Column
-        # ===================
-        # Add a separator label for clarity
-        toast_label = ttk.Label(automation_frame, text="📢 Toast Notifications:", font=("Arial", 9, "bold"))
-        toast_label.grid(row=0, column=2, sticky=tk.W, padx=(15, 5), pady=(2, 0))
-        create_tooltip(toast_label, "Configure which events trigger Windows notifications")
-
-        # Notify upload success
-        self.notify_upload_success_var = tk.BooleanVar(value=config.DEFAULT_NOTIFY_UPLOAD_SUCCESS)
-        notify_success_check = ttk.Checkbutton(
-            automation_frame,
-            text="Upload succeeded",
-            variable=self.notify_upload_success_var,
-            command=self._on_notify_upload_success_changed
-        )
-        notify_success_check.grid(row=1, column=2, sticky=tk.W, padx=(15, 5), pady=2)
-        create_tooltip(
-            notify_success_check,
-            "Show notification when a video uploads successfully\n"
-            "Good for monitoring progress when minimized"
-        )
-
-        # Notify upload failed
-        self.notify_upload_failed_var = tk.BooleanVar(value=config.DEFAULT_NOTIFY_UPLOAD_FAILED)
-        notify_failed_check = ttk.Checkbutton(
-            automation_frame,
-            text="Upload failed",
-            variable=self.notify_upload_failed_var,
-            command=self._on_notify_upload_failed_changed
-        )
-        notify_failed_check.grid(row=2, column=2, sticky=tk.W, padx=(15, 5), pady=2)
-        create_tooltip(
-            notify_failed_check,
-            "Show notification when a video upload fails\n"
-            "Alerts you to errors that need attention"
-        )
-
-        # Notify quota exceeded
-        self.notify_quota_exceeded_var = tk.BooleanVar(value=config.DEFAULT_NOTIFY_QUOTA_EXCEEDED)
-        notify_quota_check = ttk.Checkbutton(
-            automation_frame,
-            text="Quota exceeded",
-            variable=self.notify_quota_exceeded_var,
-            command=self._on_notify_quota_exceeded_changed
-        )
-        notify_quota_check.grid(row=3, column=2, sticky=tk.W, padx=(15, 5), pady=2)
-        create_tooltip(
-            notify_quota_check,
-            "Show notification when YouTube API quota is exceeded\n"
-            "Lets you know uploads will resume in 24 hours"
-        )
-
-        # Notify batch complete
-        self.notify_batch_complete_var = tk.BooleanVar(value=config.DEFAULT_NOTIFY_BATCH_COMPLETE)
-        notify_batch_check = ttk.Checkbutton(
-            automation_frame,
-            text="Batch complete",
-            variable=self.notify_batch_complete_var,
-            command=self._on_notify_batch_complete_changed
-        )
-        notify_batch_check.grid(row=4, column=2, sticky=tk.W, padx=(15, 5), pady=2)
-        create_tooltip(
-            notify_batch_check,
-            "Show notification when all videos in batch are uploaded\n"
-            "Useful for knowing when a large batch finishes"
-        )
-
-        # Disable toast checkboxes if win11toast not available
-        if not self.notification_manager.is_available():
-            for checkbox in [notify_success_check, notify_failed_check, notify_quota_check, notify_batch_check]:
-                checkbox.config(state=tk.DISABLED)
+        # Holds the checkboxes once built (see _build_automation_panel)
+        self.automation_content_frame = ttk.Frame(automation_frame)
+        self._automation_built = False
 
         # ===================
         # Next Check Frame
@@ -478,7 +519,7 @@ class YouTubeUploaderGUI:
         next_check_frame = ttk.Frame(self.root)
         next_check_frame.pack(fill=tk.X, padx=5, pady=5)
 
-        self.next_check_var = tk.StringVar(value="Next check: Not scheduled")
+        self.next_check_var = tk.StringVar(self.root, value="Next check: Not scheduled")
         next_check_label = ttk.Label(
             next_check_frame,
             textvariable=self.next_check_var
@@ -492,7 +533,7 @@ class YouTubeUploaderGUI:
         progress_frame = ttk.Frame(self.root)
         progress_frame.pack(fill=tk.X, padx=5, pady=5)
 
-        self.progress_var = tk.DoubleVar()
+        self.progress_var = tk.DoubleVar(self.root)
         self.progress_bar = ttk.Progressbar(
             progress_frame,
             variable=self.progress_var,
@@ -582,11 +623,12 @@ class YouTubeUploaderGUI:
         scrollbar = ttk.Scrollbar(log_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Create text widget
+        # Create text widget (read-only; _append_to_log enables it briefly)
         self.log_text = tk.Text(
             log_frame,
             height=config.GUI_LOG_HEIGHT,
-            yscrollcommand=scrollbar.set
+            yscrollcommand=scrollbar.set,
+            state=tk.DISABLED
         )
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         create_tooltip(self.log_text, "Activity log showing all app operations and status messages")
@@ -596,7 +638,7 @@ class YouTubeUploaderGUI:
         # ===================
         # Status Bar
         # ===================
-        self.status_var = tk.StringVar(value="Ready")
+        self.status_var = tk.StringVar(self.root, value="Ready")
         self.status_bar = ttk.Label(
             self.root,
             textvariable=self.status_var,
@@ -609,13 +651,211 @@ class YouTubeUploaderGUI:
         self.log("YouTube Uploader initialized successfully")
         self.log(f"Version: {config.APP_VERSION}")
     
+    def _on_toggle_automation_panel(self):
+        """
+        Handler for the Show/Hide Automation Settings button.
+
+        Builds the panel on first use, then just shows or hides it.
+        """
+        if self.automation_content_frame.winfo_ismapped():
+            self.automation_content_frame.pack_forget()
+            self.automation_toggle_button.config(text="Show Automation Settings")
+            return
+
+        # Build first, then pack: the grid is laid out once when mapped
+        self._build_automation_panel()
+        self.automation_content_frame.pack(fill=tk.X)
+        self.automation_toggle_button.config(text="Hide Automation Settings")
+
+    def _build_automation_panel(self):
+        """
+        Creates the automation and toast notification checkboxes (once).
+
+        Deferred until the panel is first expanded: most sessions never
+        open it, and every ttk widget costs a Tcl command plus its Python
+        wrapper at startup. The checkboxes are bound to the
+        BooleanVars created in _setup_gui_components(), so they show the
+        current settings whenever they are built.
+        """
+        if self._automation_built:
+            return
+        self._automation_built = True
+
+        create_tooltip = self.tooltip_manager.add
+        content_frame = self.automation_content_frame
+
+        # Use grid layout with 3 columns for better organization
+        # Column 0: Automation controls
+        # Column 1: Windows integration
+        # Column 2: Toast notifications
+        #
+        # The frame isn't packed until every child has been gridded (see
+        # _on_toggle_automation_panel), so Tk negotiates the grid once, at
+        # the next idle, instead of re-laying out a visible panel per widget
+
+        # Autonomous mode checkbox
+        autonomous_check = ttk.Checkbutton(
+            content_frame,
+            text="Autonomous Mode (set and forget)",
+            variable=self.autonomous_mode_var,
+            command=self._on_autonomous_mode_changed
+        )
+        autonomous_check.grid(row=0, column=0, sticky=tk.W, padx=5, pady=2)
+        create_tooltip(
+            autonomous_check,
+            "Enable fully autonomous operation:\n"
+            "- Auto-start watching on app launch\n"
+            "- Start minimized to tray\n"
+            "- No manual intervention required"
+        )
+
+        # Auto-start watching checkbox
+        auto_start_check = ttk.Checkbutton(
+            content_frame,
+            text="Auto-start watching on launch",
+            variable=self.auto_start_watching_var,
+            command=self._on_auto_start_watching_changed
+        )
+        auto_start_check.grid(row=1, column=0, sticky=tk.W, padx=5, pady=2)
+        create_tooltip(
+            auto_start_check,
+            "Automatically begin monitoring the watch folder when app starts\n"
+            "No need to click 'Start Watching' button manually"
+        )
+
+        # Start minimized checkbox
+        start_minimized_check = ttk.Checkbutton(
+            content_frame,
+            text="Start minimized to tray",
+            variable=self.start_minimized_var,
+            command=self._on_start_minimized_changed
+        )
+        start_minimized_check.grid(row=2, column=0, sticky=tk.W, padx=5, pady=2)
+        create_tooltip(
+            start_minimized_check,
+            "Start the app minimized to system tray instead of showing window\n"
+            "Useful for running silently in the background"
+        )
+
+        # Notify when empty checkbox
+        notify_empty_check = ttk.Checkbutton(
+            content_frame,
+            text="Notify when folder is empty",
+            variable=self.notify_when_empty_var,
+            command=self._on_notify_when_empty_changed
+        )
+        notify_empty_check.grid(row=0, column=1, sticky=tk.W, padx=5, pady=2)
+        create_tooltip(
+            notify_empty_check,
+            "Show Windows notification when all videos have been uploaded\n"
+            "Lets you know when you can add more videos"
+        )
+
+        # Start with Windows checkbox (disabled if startup integration is unavailable)
+        startup_available = self.windows_integration.is_startup_available()
+        start_with_windows_check = ttk.Checkbutton(
+            content_frame,
+            text="Start with Windows",
+            variable=self.start_with_windows_var,
+            command=self._on_start_with_windows_changed,
+            state=tk.NORMAL if startup_available else tk.DISABLED
+        )
+        start_with_windows_check.grid(row=1, column=1, sticky=tk.W, padx=5, pady=2)
+        if startup_available:
+            create_tooltip(
+                start_with_windows_check,
+                "Add YouTube Uploader to Windows startup folder\n"
+                "App will launch automatically when Windows starts\n"
+                "(Requires restart to take effect)"
+            )
+        else:
+            create_tooltip(
+                start_with_windows_check,
+                "Windows startup integration not available\n"
+                "(Requires pywin32 and winshell packages)"
+            )
+
+        # ===================
+        # Toast Notifications Column
+        # ===================
+        # Add a separator label for clarity
+        toast_label = ttk.Label(content_frame, text="📢 Toast Notifications:", font=("Arial", 9, "bold"))
+        toast_label.grid(row=0, column=2, sticky=tk.W, padx=(15, 5), pady=(2, 0))
+        create_tooltip(toast_label, "Configure which events trigger Windows notifications")
+
+        # Without win11toast the checkboxes couldn't do anything, so show
+        # a single hint instead of building them disabled
+        if not self.notification_manager.is_available():
+            unavailable_label = ttk.Label(
+                content_frame,
+                text="Notifications unavailable\n(install win11toast)"
+            )
+            unavailable_label.grid(row=1, column=2, rowspan=2, sticky=tk.NW, padx=(15, 5), pady=2)
+            create_tooltip(
+                unavailable_label,
+                "Windows notifications require the 'win11toast' package\n"
+                "Install with: pip install win11toast"
+            )
+            return
+
+        for row, (key, label, tooltip) in enumerate(_TOAST_PREFERENCES, start=1):
+            checkbox = ttk.Checkbutton(
+                content_frame,
+                text=label,
+                variable=getattr(self, f'{key}_var'),
+                command=functools.partial(self._on_toast_preference_changed, key, label)
+            )
+            checkbox.grid(row=row, column=2, sticky=tk.W, padx=(15, 5), pady=2)
+            create_tooltip(checkbox, tooltip)
+
     def _populate_playlist_dropdown(self):
         """
-        Populates the playlist dropdown with user's playlists from auth_manager.
+        Queues fetching the user's playlists on the background job thread.
+
+        The dropdown is disabled until _apply_playlists() fills it, so the
+        window appears without waiting for the playlist API round trips.
+        """
+        self.playlist_combo.configure(state=tk.DISABLED)
+
+        self._submit_background(self._fetch_playlists_worker)
+
+    def _fetch_playlists_worker(self):
+        """
+        Background job: fetches playlists and queues the dropdown update.
+        """
+        try:
+            self.auth_manager.fetch_playlists()
+        finally:
+            # fetch_playlists() keeps the default "No Playlist" on errors
+            self._run_on_ui(self._apply_playlists, self.auth_manager.get_playlist_titles())
+
+    def _apply_playlists(self, playlist_titles):
+        """
+        Fills the playlist dropdown and applies the selected playlist
+        (must run on main thread).
+
+        A saved playlist that no longer exists falls back to "No Playlist".
+        Also called after the periodic client refresh; does nothing if the
+        playlists weren't re-fetched (get_playlist_titles() then returns
+        the same cached tuple).
+
+        Args:
+            playlist_titles (tuple): Playlist titles including "No Playlist"
         """
-        playlist_titles = self.auth_manager.get_playlist_titles()
-        self.playlist_combo.configure(values=playlist_titles)
-        self.playlist_var.set("No Playlist")
+        if playlist_titles is self._playlist_titles:
+            return
+        self._playlist_titles = playlist_titles
+
+        self.playlist_combo.configure(values=playlist_titles, state="readonly")
+        self.log(f"Loaded {len(playlist_titles) - 1} playlist(s)")
+
+        playlist_title = self.playlist_var.get()
+        if playlist_title not in playlist_titles:
+            playlist_title = "No Playlist"
+            self.playlist_var.set(playlist_title)
+
+        self.upload_manager.set_playlist(self.auth_manager.get_playlist_id(playlist_title))
+        self._playlists_loaded.set()
 
     # -------------------------------------------------------------------------
     # Preference Management
@@ -634,35 +874,34 @@ class YouTubeUploaderGUI:
         """
         prefs = self.state_manager.get_all_preferences()
 
+        # The variables (and upload_manager) already hold the defaults they
+        # were created with, so only values that differ are set - each set()
+        # is a Tcl round trip plus trace callbacks
+
         # Apply UI preferences
         if prefs.get('last_watch_folder'):
             self.folder_path_var.set(prefs['last_watch_folder'])
 
-        if prefs.get('privacy_setting'):
-            self.privacy_var.set(prefs['privacy_setting'])
-            self.upload_manager.set_privacy(prefs['privacy_setting'])
-
-        if prefs.get('playlist_title'):
-            self.playlist_var.set(prefs['playlist_title'])
-            playlist_id = self.auth_manager.get_playlist_id(prefs['playlist_title'])
-            self.upload_manager.set_playlist(playlist_id)
+        privacy = prefs.get('privacy_setting')
+        if privacy and privacy != config.DEFAULT_PRIVACY_SETTING:
+            self.privacy_var.set(privacy)
+            self.upload_manager.set_privacy(privacy)
 
-        if prefs.get('video_category'):
-            self.category_var.set(prefs['video_category'])
-            self.upload_manager.set_category(prefs['video_category'])
+        # The playlist ID is resolved by _apply_playlists() once fetched
+        playlist_title = prefs.get('playlist_title')
+        if playlist_title and playlist_title != "No Playlist":
+            self.playlist_var.set(playlist_title)
 
-        # Apply automation preferences
-        self.autonomous_mode_var.set(prefs.get('autonomous_mode', config.DEFAULT_AUTONOMOUS_MODE))
-        self.auto_start_watching_var.set(prefs.get('auto_start_watching', config.DEFAULT_AUTO_START_WATCHING))
-        self.start_minimized_var.set(prefs.get('start_minimized', config.DEFAULT_START_MINIMIZED))
-        self.notify_when_empty_var.set(prefs.get('notify_when_empty', config.DEFAULT_NOTIFY_WHEN_EMPTY))
-        self.start_with_windows_var.set(prefs.get('start_with_windows', False))
+        category = prefs.get('video_category')
+        if category and category != config.DEFAULT_VIDEO_CATEGORY:
+            self.category_var.set(category)
+            self.upload_manager.set_category(category)
 
-        # Apply toast notification preferences
-        self.notify_upload_success_var.set(prefs.get('notify_upload_success', config.DEFAULT_NOTIFY_UPLOAD_SUCCESS))
-        self.notify_upload_failed_var.set(prefs.get('notify_upload_failed', config.DEFAULT_NOTIFY_UPLOAD_FAILED))
-        self.notify_quota_exceeded_var.set(prefs.get('notify_quota_exceeded', config.DEFAULT_NOTIFY_QUOTA_EXCEEDED))
-        self.notify_batch_complete_var.set(prefs.get('notify_batch_complete', config.DEFAULT_NOTIFY_BATCH_COMPLETE))
+        # Apply automation and toast notification preferences
+        for key, default in _BOOLEAN_PREFERENCES:
+            value = prefs.get(key, default)
+            if value != default:
+                getattr(self, f'{key}_var').set(value)
 
         self.log("User preferences loaded successfully")
 
@@ -679,13 +918,25 @@ class YouTubeUploaderGUI:
         except Exception as e:
             self.log(f"Warning: Could not save preference '{key}': {str(e)}")
 
+    def _save_preferences(self, preferences):
+        """
+        Saves several preferences to persistent storage in one write.
+
+        Args:
+            preferences (dict): Preference key -> value
+        """
+        try:
+            self.state_manager.set_preferences(preferences)
+        except Exception as e:
+            self.log(f"Warning: Could not save preferences {', '.join(preferences)}: {str(e)}")
+
     def _apply_automation_preferences(self):
         """
         Applies automation preferences after GUI is fully loaded.
 
         This handles:
         - Auto-starting folder watching
-        - Minimizing to tray on startup
+        - Minimizing to tray on startup (or showing the window)
         - Autonomous mode (combines both above)
         """
         # Autonomous mode overrides individual settings
@@ -698,9 +949,12 @@ class YouTubeUploaderGUI:
             # Need to wait for GUI to be fully rendered
             self.root.after(100, self._auto_start_watching)
 
-        # Minimize to tray if enabled
+        # Minimize to tray if enabled (the window is still hidden, so it
+        # never flashes on screen), otherwise show the finished window
         if self.start_minimized_var.get():
             self.root.after(200, self.window_manager.minimize_to_tray)
+        else:
+            self.root.deiconify()
 
     def _auto_start_watching(self):
         """
@@ -723,22 +977,25 @@ class YouTubeUploaderGUI:
         When enabled, automatically enables auto-start and start-minimized.
         """
         autonomous = self.autonomous_mode_var.get()
-        self._save_preference('autonomous_mode', autonomous)
 
         if autonomous:
-            # Enable dependent settings
+            # Enable dependent settings (saved together in one write)
             self.auto_start_watching_var.set(True)
             self.start_minimized_var.set(True)
-            self._save_preference('auto_start_watching', True)
-            self._save_preference('start_minimized', True)
+            self._save_preferences({
+                'autonomous_mode': True,
+                'auto_start_watching': True,
+                'start_minimized': True
+            })
             self.log("Autonomous mode enabled (auto-start + minimized startup)")
         else:
+            self._save_preference('autonomous_mode', False)
             self.log("Autonomous mode disabled")
 
     def _on_auto_start_watching_changed(self):
         """Handler for auto-start watching checkbox."""
         auto_start = self.auto_start_watching_var.get()
-        self._save_preference('auto_start_watching', auto_start)
+        changes = {'auto_start_watching': auto_start}
 
         if auto_start:
             self.log("Auto-start watching enabled (will start monitoring on app launch)")
@@ -747,12 +1004,14 @@ class YouTubeUploaderGUI:
             # Disable autonomous mode if auto-start is disabled
             if self.autonomous_mode_var.get():
                 self.autonomous_mode_var.set(False)
-                self._save_preference('autonomous_mode', False)
+                changes['autonomous_mode'] = False
+
+        self._save_preferences(changes)
 
     def _on_start_minimized_changed(self):
         """Handler for start minimized checkbox."""
         start_minimized = self.start_minimized_var.get()
-        self._save_preference('start_minimized', start_minimized)
+        changes = {'start_minimized': start_minimized}
 
         if start_minimized:
             self.log("Start minimized enabled (app will start in system tray)")
@@ -761,7 +1020,9 @@ class YouTubeUploaderGUI:
             # Disable autonomous mode if start minimized is disabled
             if self.autonomous_mode_var.get():
                 self.autonomous_mode_var.set(False)
-                self._save_preference('autonomous_mode', False)
+                changes['autonomous_mode'] = False
+
+        self._save_preferences(changes)
 
     def _on_notify_when_empty_changed(self):
         """Handler for notify when empty checkbox."""
@@ -822,31 +1083,28 @@ class YouTubeUploaderGUI:
             # Revert checkbox state
             self.start_with_windows_var.set(not start_with_windows)
 
-    def _on_notify_upload_success_changed(self):
-        """Handler for upload success notification checkbox."""
-        notify = self.notify_upload_success_var.get()
-        self._save_preference('notify_upload_success', notify)
-        self.log(f"Upload success notifications {'enabled' if notify else 'disabled'}")
-
-    def _on_notify_upload_failed_changed(self):
-        """Handler for upload failed notification checkbox."""
-        notify = self.notify_upload_failed_var.get()
-        self._save_preference('notify_upload_failed', notify)
-        self.log(f"Upload failed notifications {'enabled' if notify else 'disabled'}")
-
-    def _on_notify_quota_exceeded_changed(self):
-        """Handler for quota exceeded notification checkbox."""
-        notify = self.notify_quota_exceeded_var.get()
-        self._save_preference('notify_quota_exceeded', notify)
-        self.log(f"Quota exceeded notifications {'enabled' if notify else 'disabled'}")
-
-    def _on_notify_batch_complete_changed(self):
-        """Handler for batch complete notification checkbox."""
-        notify = self.notify_batch_complete_var.get()
-        self._save_preference('notify_batch_complete', notify)
-        self.log(f"Batch complete notifications {'enabled' if notify else 'disabled'}")
+    def _sync_notify_flag(self, key, *trace_args):
+        """
+        Copies a notification setting into _notify_flags (variable write trace).
+
+        Args:
+            key (str): Preference key, e.g. 'notify_upload_success'
+            *trace_args: Tk trace arguments (unused)
+        """
+        self._notify_flags[key] = getattr(self, f'{key}_var').get()
+
+    def _on_toast_preference_changed(self, key, label):
+        """
+        Handler for the toast notification checkboxes (see _TOAST_PREFERENCES).
+
+        Args:
+            key (str): Preference key, e.g. 'notify_upload_success'
+            label (str): Checkbox label, used in the log message
+        """
+        notify = getattr(self, f'{key}_var').get()
+        self._save_preference(key, notify)
+        self.log("%s notifications %s", label, 'enabled' if notify else 'disabled')
 
-    
     # -------------------------------------------------------------------------
     # Incomplete Upload Check
     # -------------------------------------------------------------------------
@@ -861,34 +1119,163 @@ class YouTubeUploaderGUI:
             self.log(f"Found {incomplete_count} incomplete upload(s) from previous session")
             self.log("These will be retried when you start watching")
     
+    # -------------------------------------------------------------------------
+    # UI Update Queue (Thread-Safe)
+    # -------------------------------------------------------------------------
+    
+    def _run_on_ui(self, func, *args, **kwargs):
+        """
+        Queues func(*args, **kwargs) to run on the main (Tk) thread.
+        
+        Tk isn't thread-safe, so background threads must never touch
+        widgets or Tk variables directly - they call this instead.
+        
+        Args:
+            func (callable): Function to call on the main thread
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        
+        Example:
+            >>> self._run_on_ui(self.status_var.set, "Upload complete")
+            >>> self._run_on_ui(self.start_button.config, state=tk.NORMAL)
+        """
+        self._ui_queue.put((func, args, kwargs))
+    
+    def _drain_ui_queue(self):
+        """
+        Applies queued UI updates, then re-schedules itself.
+        
+        Runs on the main thread every config.GUI_UI_QUEUE_POLL_MS, applying
+        at most config.GUI_UI_QUEUE_MAX_ITEMS updates per pass. Log lines
+        are inserted with a single _append_to_log() call, and only while the
+        window is visible: when minimized to tray they're kept in
+        _pending_log_lines and inserted in one go once it's restored.
+        """
+        # Looked up once per drain, not once per queued item (comparing
+        # against self._append_to_log would build a new bound method each time)
+        pending_log_lines = self._pending_log_lines
+        get_nowait = self._ui_queue.get_nowait
+        append_to_log = self._append_to_log
+        backlog = True
+        for _ in range(config.GUI_UI_QUEUE_MAX_ITEMS):
+            try:
+                func, args, kwargs = get_nowait()
+            except queue.Empty:
+                backlog = False
+                break
+            
+            if func == append_to_log:
+                # Queued by log(): (timestamp, message, args)
+                pending_log_lines.append(args)
+                continue
+            
+            try:
+                func(*args, **kwargs)
+            except Exception as e:
+                print(f"Error applying UI update: {e}", file=sys.stderr)
+        
+        if pending_log_lines and self.root.state() != 'withdrawn':
+            self._append_to_log(_format_log_lines(pending_log_lines))
+            pending_log_lines.clear()
+        
+        if backlog:
+            # More is queued: continue once Tk has processed pending events
+            self.root.after_idle(self._drain_ui_queue)
+        else:
+            self.root.after(config.GUI_UI_QUEUE_POLL_MS, self._drain_ui_queue)
+    
+    def _set_progress(self, percent, status=None):
+        """
+        Shows progress (and optionally a status message). Thread-safe.
+
+        Updates are coalesced: however many arrive between two queue
+        drains, one _apply_progress() call applies only the latest, and
+        the progress bar is only touched when the whole percent changes.
+
+        Args:
+            percent (float): Progress 0-100, or None to leave it unchanged
+            status (str, optional): Status bar text, or None to leave it unchanged
+        """
+        with self._progress_lock:
+            pending = self._pending_progress
+            if pending is None:
+                self._run_on_ui(self._apply_progress)
+            else:
+                # Keep the parts this update doesn't change
+                if percent is None:
+                    percent = pending[0]
+                if status is None:
+                    status = pending[1]
+            self._pending_progress = (percent, status)
+
+    def _apply_progress(self):
+        """
+        Applies the latest _set_progress() values (must run on main thread).
+        """
+        with self._progress_lock:
+            percent, status = self._pending_progress
+            self._pending_progress = None
+
+        if percent is not None and int(percent) != self._shown_percent:
+            self._shown_percent = int(percent)
+            self.progress_var.set(self._shown_percent)
+        if status is not None:
+            self.status_var.set(status)
+    
     # -------------------------------------------------------------------------
     # Logging (Thread-Safe)
     # -------------------------------------------------------------------------
     
-    def log(self, message):
+    def log(self, message, *args):
         """
         Adds a timestamped message to the log window.
         
-        This is thread-safe - can be called from background thread.
+        This is thread-safe - can be called from background thread. With
+        args, message is %-formatted on the main thread when the line is
+        shown, like the logging module does.
         
         Args:
             message (str): Message to log
+            *args: Values for %-style placeholders in message
+        
+        Example:
+            >>> gui.log("Starting upload %d/%d: %s", 1, 3, "video.mp4")
         """
-        timestamp = datetime.now().strftime(config.LOG_TIMESTAMP_FORMAT)
-        log_line = f"{timestamp}: {message}\n"
+        # Format the timestamp once per second (LOG_TIMESTAMP_FORMAT has
+        # one-second resolution); lines logged in bursts reuse it. The pair
+        # is replaced in one assignment, so threads never see a torn value
+        second = int(time.time())
+        cached_second, timestamp = self._log_timestamp
+        if second != cached_second:
+            timestamp = time.strftime(config.LOG_TIMESTAMP_FORMAT, time.localtime(second))
+            self._log_timestamp = (second, timestamp)
         
-        # Schedule GUI update on main thread
-        self.root.after(0, self._append_to_log, log_line)
+        # Queue GUI update for the main thread (_drain_ui_queue formats it)
+        self._run_on_ui(self._append_to_log, timestamp, message, args)
     
     def _append_to_log(self, text):
         """
         Internal method to append text to log widget (must run on main thread).
         
+        Once the window holds more than config.GUI_LOG_MAX_LINES plus
+        config.GUI_LOG_TRIM_LINES lines, it is trimmed back to the newest
+        GUI_LOG_MAX_LINES.
+        
         Args:
             text (str): Text to append
         """
         try:
+            self.log_text.configure(state=tk.NORMAL)
             self.log_text.insert(tk.END, text)
+            
+            # Drop the oldest lines beyond the cap in batches ('end-1c' is
+            # the last character, on the empty line after the final newline)
+            line_count = int(self.log_text.index('end-1c').split('.')[0]) - 1
+            overflow = line_count - config.GUI_LOG_MAX_LINES
+            if overflow > config.GUI_LOG_TRIM_LINES:
+                self.log_text.delete('1.0', f'{overflow + 1}.0')
+            
+            self.log_text.configure(state=tk.DISABLED)
             self.log_text.see(tk.END)  # Auto-scroll to bottom
         except Exception as e:
             # If GUI is being destroyed, this might fail - ignore
@@ -957,11 +1344,36 @@ class YouTubeUploaderGUI:
             )
             return
 
-        # Get playlist size to estimate quota cost
-        self.log(f"Checking playlist size...")
+        # Disable button while checking and sorting
+        self.sort_playlist_button.config(state=tk.DISABLED)
+
+        # Get playlist size to estimate quota cost (an API call, so it runs
+        # on the background thread; the confirmation follows on this one)
+        self.log("Checking playlist size...")
+        self._submit_background(self._check_playlist_for_sort, playlist_id, playlist_title)
+
+    def _check_playlist_for_sort(self, playlist_id, playlist_title):
+        """
+        Background job: gets the playlist size and queues the sort confirmation.
+
+        Args:
+            playlist_id (str): ID of the playlist to sort
+            playlist_title (str): Title of the playlist, for messages
+        """
         item_count = self.upload_manager.get_playlist_item_count(playlist_id)
+        self._run_on_ui(self._confirm_playlist_sort, playlist_id, playlist_title, item_count)
+
+    def _confirm_playlist_sort(self, playlist_id, playlist_title, item_count):
+        """
+        Asks the user to confirm a playlist sort, then queues it (main thread).
 
+        Args:
+            playlist_id (str): ID of the playlist to sort
+            playlist_title (str): Title of the playlist, for messages
+            item_count (int): Number of videos in the playlist (0 on error)
+        """
         if item_count == 0:
+            self.sort_playlist_button.config(state=tk.NORMAL)
             self.dialog_manager.show_warning(
                 "Empty Playlist",
                 "This playlist appears to be empty or could not be accessed.\n\n"
@@ -1003,11 +1415,10 @@ class YouTubeUploaderGUI:
         )
 
         if not confirm:
+            self.sort_playlist_button.config(state=tk.NORMAL)
             self.log("Playlist sort cancelled by user")
             return
 
-        # Disable button during sort
-        self.sort_playlist_button.config(state=tk.DISABLED)
         self.log(f"Starting sort for playlist: {playlist_title}")
 
         # Run sort in background thread to avoid freezing GUI
@@ -1015,10 +1426,8 @@ class YouTubeUploaderGUI:
             try:
                 # Progress callback to update GUI
                 def progress(current, total, message):
-                    self.status_var.set(f"Sorting: {current}/{total}")
-                    if total > 0:
-                        percent = (current / total) * 100
-                        self.progress_var.set(percent)
+                    percent = (current / total) * 100 if total > 0 else None
+                    self._set_progress(percent, f"Sorting: {current}/{total}")
                     self.log(message)
 
                 # Perform the sort
@@ -1028,38 +1437,40 @@ class YouTubeUploaderGUI:
                 )
 
                 # Reset progress
-                self.progress_var.set(0)
+                self._set_progress(0)
 
                 # Re-enable button
-                self.sort_playlist_button.config(state=tk.NORMAL)
+                self._run_on_ui(self.sort_playlist_button.config, state=tk.NORMAL)
 
                 # Show result to user
                 if success:
-                    self.status_var.set("Playlist sorted successfully")
-                    self.dialog_manager.show_info(
+                    self._run_on_ui(self.status_var.set, "Playlist sorted successfully")
+                    self._run_on_ui(
+                        self.dialog_manager.show_info,
                         "Sort Complete",
                         f"{message}\n\n"
                         f"Playlist '{playlist_title}' has been sorted alphabetically."
                     )
                 else:
-                    self.status_var.set("Playlist sort failed")
-                    self.dialog_manager.show_error(
+                    self._run_on_ui(self.status_var.set, "Playlist sort failed")
+                    self._run_on_ui(
+                        self.dialog_manager.show_error,
                         "Sort Failed",
                         f"Failed to sort playlist:\n\n{message}"
                     )
 
             except Exception as e:
                 self.log(f"Error during playlist sort: {str(e)}")
-                self.sort_playlist_button.config(state=tk.NORMAL)
-                self.status_var.set("Sort error")
-                self.dialog_manager.show_error(
+                self._run_on_ui(self.sort_playlist_button.config, state=tk.NORMAL)
+                self._run_on_ui(self.status_var.set, "Sort error")
+                self._run_on_ui(
+                    self.dialog_manager.show_error,
                     "Sort Error",
                     f"An error occurred during sorting:\n\n{str(e)}"
                 )
 
-        # Start the sort thread
-        thread = threading.Thread(target=sort_thread, daemon=True)
-        thread.start()
+        # Queue the sort on the background thread
+        self._submit_background(sort_thread)
     
     # -------------------------------------------------------------------------
     # Event Handlers - Folder Selection
@@ -1089,7 +1500,8 @@ class YouTubeUploaderGUI:
             # User cancelled
             return
 
-        self.log(f"Single file upload selected: {os.path.basename(filepath)}")
+        filename = os.path.basename(filepath)
+        self.log(f"Single file upload selected: {filename}")
 
         # Disable upload button during upload
         self.upload_file_button.config(state=tk.DISABLED)
@@ -1097,63 +1509,68 @@ class YouTubeUploaderGUI:
         # Run upload in background thread to avoid freezing GUI
         def upload_thread():
             try:
+                # Upload into the selected playlist, not the default
+                self._wait_for_playlists()
+
                 # Update status
-                self.status_var.set(f"Uploading: {os.path.basename(filepath)}")
+                self._run_on_ui(self.status_var.set, f"Uploading: {filename}")
 
                 # Perform upload
                 success, message, video_id = self.upload_manager.upload_video(filepath)
 
                 # Reset progress
-                self.progress_var.set(0)
+                self._set_progress(0)
 
                 # Re-enable button
-                self.upload_file_button.config(state=tk.NORMAL)
+                self._run_on_ui(self.upload_file_button.config, state=tk.NORMAL)
 
                 # Show result to user
                 if success:
-                    self.status_var.set("Upload complete")
+                    self._run_on_ui(self.status_var.set, "Upload complete")
                     self.log(message)
 
                     # Notify upload success if enabled
-                    if self.notify_upload_success_var.get():
+                    if self._notify_flags['notify_upload_success']:
                         self.notification_manager.show_notification(
                             "Upload Succeeded",
-                            f"Successfully uploaded: {os.path.basename(filepath)}",
+                            f"Successfully uploaded: {filename}",
                             duration=3
                         )
 
-                    self.dialog_manager.show_info(
+                    self._run_on_ui(
+                        self.dialog_manager.show_info,
                         "Upload Successful",
                         f"Video uploaded successfully!\n\n"
-                        f"File: {os.path.basename(filepath)}\n"
+                        f"File: {filename}\n"
                         f"Video ID: {video_id}"
                     )
                 else:
-                    self.status_var.set("Upload failed")
+                    self._run_on_ui(self.status_var.set, "Upload failed")
                     self.log(f"Upload failed: {message}")
 
                     # Notify upload failed if enabled
-                    if self.notify_upload_failed_var.get():
+                    if self._notify_flags['notify_upload_failed']:
                         self.notification_manager.show_notification(
                             "Upload Failed",
-                            f"Failed to upload {os.path.basename(filepath)}: {message}",
+                            f"Failed to upload {filename}: {message}",
                             duration=5
                         )
 
-                    self.dialog_manager.show_error(
+                    self._run_on_ui(
+                        self.dialog_manager.show_error,
                         "Upload Failed",
                         f"Failed to upload video:\n\n{message}"
                     )
 
             except Exception as e:
                 self.log(f"Error during single file upload: {str(e)}")
-                self.upload_file_button.config(state=tk.NORMAL)
-                self.status_var.set("Upload error")
+                self._run_on_ui(self.upload_file_button.config, state=tk.NORMAL)
+                self._run_on_ui(self.status_var.set, "Upload error")
 
                 # Check if it was a quota error
-                if "QuotaExceededError" in str(type(e)) or "quotaExceeded" in str(e):
+                if _is_quota_error(e):
                     # Notify quota exceeded if enabled
-                    if self.notify_quota_exceeded_var.get():
+                    if self._notify_flags['notify_quota_exceeded']:
                         self.notification_manager.show_notification(
                             "Quota Exceeded",
                             "YouTube API quota exceeded. Try again in 24 hours.",
@@ -1161,21 +1578,21 @@ class YouTubeUploaderGUI:
                         )
                 else:
                     # Notify upload failed if enabled
-                    if self.notify_upload_failed_var.get():
+                    if self._notify_flags['notify_upload_failed']:
                         self.notification_manager.show_notification(
                             "Upload Error",
-                            f"Error uploading {os.path.basename(filepath)}: {str(e)}",
+                            f"Error uploading {filename}: {str(e)}",
                             duration=5
                         )
 
-                self.dialog_manager.show_error(
+                self._run_on_ui(
+                    self.dialog_manager.show_error,
                     "Upload Error",
                     f"An error occurred during upload:\n\n{str(e)}"
                 )
 
-        # Start the upload thread
-        thread = threading.Thread(target=upload_thread, daemon=True)
-        thread.start()
+        # Queue the upload on the background thread
+        self._submit_background(upload_thread)
     
     # -------------------------------------------------------------------------
     # Event Handlers - Control Buttons
@@ -1185,7 +1602,7 @@ class YouTubeUploaderGUI:
         """
         Handler for Start Watching button.
 
-        Starts the background worker thread that monitors the watch folder.
+        Schedules the first check of the watch folder (see _tick_watch).
         """
         # Validate folder is selected
         if not self.folder_path_var.get():
@@ -1199,15 +1616,11 @@ class YouTubeUploaderGUI:
         self.stop_button.config(state=tk.NORMAL)
         self.force_check_button.config(state=tk.NORMAL)
 
-        # Reset control flag
+        # Fresh stop event for this run (see should_stop)
         self.should_stop = False
 
-        # Start background worker thread
-        self.worker_thread = threading.Thread(
-            target=self._watch_folder_worker,
-            daemon=True
-        )
-        self.worker_thread.start()
+        # First check right away; each check schedules the next
+        self._watch_after_id = self.root.after(0, self._tick_watch, self.stop_event)
 
         self.log("Started watching folder for new videos")
         self.status_var.set("Watching folder...")
@@ -1216,10 +1629,15 @@ class YouTubeUploaderGUI:
         """
         Handler for Stop button.
 
-        Signals the worker thread to stop and resets button states.
+        Cancels the next scheduled check, signals a running check/upload
+        cycle to stop and resets button states.
         """
         self.should_stop = True
 
+        if self._watch_after_id is not None:
+            self.root.after_cancel(self._watch_after_id)
+            self._watch_after_id = None
+
         # Reset button states
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
@@ -1232,13 +1650,16 @@ class YouTubeUploaderGUI:
         """
         Handler for Exit button - cleanly exits the application.
         """
-        # Ask for confirmation if currently uploading
-        if hasattr(self, 'worker_thread') and self.worker_thread.is_alive():
+        # Ask for confirmation if currently watching or uploading
+        watching = (self._watch_after_id is not None or
+                    not self._bg_idle.is_set() or not self._bg_jobs.empty())
+        if watching:
             confirm = self.dialog_manager.ask_yes_no(
                 "Confirm Exit",
                 "Folder watching is active.\n\n"
                 "Are you sure you want to exit?\n"
-                "(Current upload will complete before exit)"
+                "(An upload in progress will be cancelled - videos still\n"
+                "in the watch folder are uploaded again on the next start)"
             )
             if not confirm:
                 return
@@ -1250,68 +1671,141 @@ class YouTubeUploaderGUI:
         """
         Handler for Force Check Now button.
         
-        Immediately checks the watch folder for new videos in a background thread.
+        Checks the watch folder for new videos on the background thread
+        (right away, or after the upload/check currently running).
         """
         self.log("Force check triggered by user")
         
         # Run in background thread to avoid freezing GUI
-        check_thread = threading.Thread(
-            target=self._perform_folder_check,
-            daemon=True
-        )
-        check_thread.start()
+        self._submit_background(self._perform_folder_check, self.stop_event)
     
     # -------------------------------------------------------------------------
-    # Background Worker Thread
+    # Background Jobs
     # -------------------------------------------------------------------------
     
-    def _watch_folder_worker(self):
-        """
-        Background worker thread that monitors the watch folder.
-
-        This runs continuously until stopped, checking for:
-        - New videos in watch folder
-        - Quota cooldown status
-        - Stop signals from user
-        """
-        while not self.should_stop:
-            # Check if we're in quota cooldown
-            if self.upload_manager.is_in_cooldown():
-                cooldown_end = self.upload_manager.get_cooldown_end_time()
-
-                if cooldown_end:
-                    # Update next check display with full date and time
-                    # Show date if cooldown ends on a different day
-                    now = datetime.now()
-                    if cooldown_end.date() != now.date():
-                        # Different day - show date and time
-                        next_check_str = cooldown_end.strftime('%Y-%m-%d %H:%M:%S')
-                    else:
-                        # Same day - just show time
-                        next_check_str = cooldown_end.strftime('%H:%M:%S')
+    def _wait_for_playlists(self):
+        """
+        Waits until the selected playlist has been applied (background jobs).
+
+        Gives up after config.GUI_PLAYLIST_WAIT_SECONDS so a stuck playlist
+        fetch can't block the job thread; uploads then go to no playlist.
+        """
+        if not self._playlists_loaded.wait(timeout=config.GUI_PLAYLIST_WAIT_SECONDS):
+            self.log("Playlists not loaded yet - uploading without adding to a playlist")
+
+    def _submit_background(self, func, *args):
+        """
+        Queues func(*args) to run on the background job thread.
+
+        Jobs run one at a time in submission order. Thread-safe.
+
+        Args:
+            func (callable): Job to run
+            *args: Arguments for func
+        """
+        self._bg_jobs.put((func, args))
+
+    def _run_background_jobs(self):
+        """
+        Background thread: runs queued jobs one after another, forever.
+
+        It's a daemon thread, so quitting doesn't wait for a running upload.
+        """
+        while True:
+            func, args = self._bg_jobs.get()
+            self._bg_idle.clear()
+            try:
+                func(*args)
+            except Exception as e:
+                self.log(f"Error in background task: {str(e)}")
+            finally:
+                if self._bg_jobs.empty():
+                    self._bg_idle.set()
+    
+    # -------------------------------------------------------------------------
+    # Watch Folder Scheduling
+    # -------------------------------------------------------------------------
+    
+    def _tick_watch(self, stop_event):
+        """
+        Runs one step of folder watching (main thread, via root.after).
 
-                    self.next_check_var.set(f"Next check: {next_check_str}")
-                    self.log(f"In 24-hour cooldown. Next check at {next_check_str}")
+        No thread sleeps between checks: while in quota cooldown the next
+        check is simply scheduled for when it ends; otherwise a
+        check/upload cycle is queued on the background job thread, which
+        schedules the following check when it finishes.
 
-                    # Sleep until cooldown ends (in small increments to allow stop signal)
-                    seconds_until_end = (cooldown_end - datetime.now()).total_seconds()
-                    self._sleep_interruptible(seconds_until_end)
+        Args:
+            stop_event (threading.Event): This watch run's stop signal
+        """
+        self._watch_after_id = None
+        if stop_event.is_set():
+            return
 
-                    continue
+        # Check if we're in quota cooldown
+        if self.upload_manager.is_in_cooldown():
+            cooldown_end = self.upload_manager.get_cooldown_end_time()
+
+            if cooldown_end:
+                # Update next check display with full date and time
+                # Show date if cooldown ends on a different day
+                now = datetime.now()
+                if cooldown_end.date() != now.date():
+                    # Different day - show date and time
+                    next_check_str = cooldown_end.strftime('%Y-%m-%d %H:%M:%S')
+                else:
+                    # Same day - just show time
+                    next_check_str = cooldown_end.strftime('%H:%M:%S')
+
+                self.next_check_var.set(f"Next check: {next_check_str}")
+                self.log(f"In 24-hour cooldown. Next check at {next_check_str}")
+
+                # Check again when the cooldown ends (Stop cancels this)
+                delay_ms = max(0, int((cooldown_end - now).total_seconds() * 1000))
+                self._watch_after_id = self.root.after(delay_ms, self._tick_watch, stop_event)
+                return
+
+        # Perform folder check and upload cycle
+        self._submit_background(self._watch_cycle, stop_event)
 
-            # Perform folder check and upload cycle
-            self._perform_folder_check()
+    def _watch_cycle(self, stop_event):
+        """
+        Background thread: one folder check and upload cycle, then queues
+        scheduling of the next check.
 
-            # Wait before next check
-            self.next_check_var.set("Next check: Waiting for user action...")
-            self._sleep_interruptible(config.WATCH_FOLDER_POLL_INTERVAL)
+        Args:
+            stop_event (threading.Event): This watch run's stop signal
+        """
+        try:
+            self._perform_folder_check(stop_event)
+        finally:
+            self._run_on_ui(self._schedule_next_watch_check, stop_event)
+
+    def _schedule_next_watch_check(self, stop_event):
+        """
+        Schedules the next _tick_watch() after a completed cycle (main thread).
+
+        Args:
+            stop_event (threading.Event): This watch run's stop signal
+        """
+        if stop_event.is_set():
+            return
+
+        # Wait before next check
+        self.next_check_var.set("Next check: Waiting for user action...")
+        self._watch_after_id = self.root.after(
+            config.WATCH_FOLDER_POLL_INTERVAL * 1000, self._tick_watch, stop_event
+        )
     
-    def _perform_folder_check(self):
+    def _perform_folder_check(self, stop_event):
         """
         Checks the watch folder for new videos and uploads them.
 
-        This is the core upload cycle called by the worker thread.
+        This is the core upload cycle run on a background thread (watch cycle or Force Check).
         Sends notifications based on user preferences.
+
+        Args:
+            stop_event (threading.Event): Stop signal checked between uploads
         """
         try:
             # Check if YouTube client needs refresh (due to age or usage)
@@ -1325,6 +1819,9 @@ class YouTubeUploaderGUI:
                         # Update upload_manager with the refreshed client
                         self.upload_manager.set_youtube_client(self.auth_manager.youtube)
                         self.log("YouTube API client refreshed successfully")
+
+                        # Show playlists the refresh may have re-fetched
+                        self._run_on_ui(self._apply_playlists, self.auth_manager.get_playlist_titles())
                     else:
                         self.log("Warning: YouTube API client refresh failed")
                         self.log("Continuing with existing connection...")
@@ -1332,14 +1829,15 @@ class YouTubeUploaderGUI:
                     self.log(f"Warning: Could not refresh YouTube API client: {str(e)}")
                     self.log("Continuing with existing connection...")
 
-            # Get video files from watch folder
-            video_files = self.file_handler.get_video_files(self.watch_folder)
+            # Get video files from watch folder (sizes and mtimes from the same scan)
+            video_entries = self.file_handler.get_video_entries(self.watch_folder)
+            video_files = [name for name, _, _ in video_entries]
 
             if not video_files:
                 self.log("No new videos found in watch folder")
 
                 # Send notification if enabled
-                if self.notify_when_empty_var.get():
+                if self._notify_flags['notify_when_empty']:
                     self.notification_manager.show_notification(
                         "YouTube Uploader",
                         "Watch folder is empty - all videos uploaded!",
@@ -1348,36 +1846,62 @@ class YouTubeUploaderGUI:
 
                 return
 
-            self.log(f"Found {len(video_files)} video(s) to upload")
+            # Skip failed videos still waiting out their retry delay
+            video_files = self.upload_manager.filter_files_ready_for_upload(
+                self.watch_folder, video_files
+            )
+            if not video_files:
+                return
+
+            self.log("Found %d video(s) to upload", len(video_files))
 
             # Check for stop signal before starting uploads
-            if self.should_stop:
+            if stop_event.is_set():
                 self.log("Stop requested - cancelling upload batch")
                 return
 
+            # Upload into the selected playlist, not the default
+            self._wait_for_playlists()
+
+            # Full paths, joined once for the whole batch
+            watch_folder = self.watch_folder
+            filepaths = [os.path.join(watch_folder, name) for name in video_files]
+
+            # Hash the whole batch up front, in parallel
+            entry_stats = {name: (size, mtime_ns) for name, size, mtime_ns in video_entries}
+            self.upload_manager.prehash_files(
+                filepaths,
+                {filepath: entry_stats[name]
+                 for name, filepath in zip(video_files, filepaths) if name in entry_stats}
+            )
+
             # Track batch statistics
             batch_success_count = 0
             batch_fail_count = 0
             batch_size = len(video_files)
+            percent_per_file = 100.0 / batch_size
+
+            # Per-file success toasts are skipped when the batch-complete
+            # summary will report them anyway (one toast instead of N)
+            notify_each_success = self._notify_flags['notify_upload_success'] and not (
+                batch_size > 1 and self._notify_flags['notify_batch_complete']
+            )
 
-            # Upload each file
-            for i, filename in enumerate(video_files):
+            # Upload each file (number is 1-based, as shown to the user)
+            for number, (filename, filepath) in enumerate(zip(video_files, filepaths), start=1):
                 # Check for stop signal before each upload
-                if self.should_stop:
+                if stop_event.is_set():
                     self.log(f"Stop requested - stopped after {batch_success_count} of {batch_size} video(s)")
                     break
 
                 # Upload this file
-                filepath = os.path.join(self.watch_folder, filename)
-
                 try:
                     # Update progress
-                    percent = (i / len(video_files)) * 100
-                    self.progress_var.set(percent)
-                    self.status_var.set(f"Uploading {i+1} of {len(video_files)}: {filename}")
+                    percent = (number - 1) * percent_per_file
+                    self._set_progress(percent, f"Uploading {number} of {batch_size}: {filename}")
 
                     # Log start of upload (helps user see what's being uploaded)
-                    self.log(f"Starting upload {i+1}/{len(video_files)}: {filename}")
+                    self.log("Starting upload %d/%d: %s", number, batch_size, filename)
 
                     # Perform upload (this is a long-running operation that cannot be interrupted)
                     success, message, video_id = self.upload_manager.upload_video(filepath)
@@ -1387,7 +1911,7 @@ class YouTubeUploaderGUI:
                         batch_success_count += 1
 
                         # Notify upload success if enabled
-                        if self.notify_upload_success_var.get():
+                        if notify_each_success:
                             self.notification_manager.show_notification(
                                 "Upload Succeeded",
                                 f"Successfully uploaded: {filename}",
@@ -1398,7 +1922,7 @@ class YouTubeUploaderGUI:
                         batch_fail_count += 1
 
                         # Notify upload failed if enabled (and not a duplicate/already uploaded)
-                        if self.notify_upload_failed_var.get() and "already uploaded" not in message.lower():
+                        if self._notify_flags['notify_upload_failed'] and "already uploaded" not in message.lower():
                             self.notification_manager.show_notification(
                                 "Upload Failed",
                                 f"Failed to upload {filename}: {message}",
@@ -1410,11 +1934,11 @@ class YouTubeUploaderGUI:
                     batch_fail_count += 1
 
                     # Check if it was a quota error
-                    if "QuotaExceededError" in str(type(e)) or "quotaExceeded" in str(e):
+                    if _is_quota_error(e):
                         self.log("Quota exceeded, stopping upload cycle")
 
                         # Notify quota exceeded if enabled
-                        if self.notify_quota_exceeded_var.get():
+                        if self._notify_flags['notify_quota_exceeded']:
                             self.notification_manager.show_notification(
                                 "Quota Exceeded",
                                 "YouTube API quota exceeded. Uploads will resume in 24 hours.",
@@ -1423,7 +1947,7 @@ class YouTubeUploaderGUI:
                         break
                     else:
                         # Notify upload failed if enabled
-                        if self.notify_upload_failed_var.get():
+                        if self._notify_flags['notify_upload_failed']:
                             self.notification_manager.show_notification(
                                 "Upload Error",
                                 f"Error uploading {filename}: {str(e)}",
@@ -1431,11 +1955,10 @@ class YouTubeUploaderGUI:
                             )
 
             # Reset progress
-            self.progress_var.set(0)
-            self.status_var.set("Upload cycle complete")
+            self._set_progress(0, "Upload cycle complete")
 
             # Notify batch complete if enabled and we uploaded something
-            if self.notify_batch_complete_var.get() and batch_success_count > 0:
+            if self._notify_flags['notify_batch_complete'] and batch_success_count > 0:
                 summary = f"Uploaded {batch_success_count} of {batch_size} video(s)"
                 if batch_fail_count > 0:
                     summary += f" ({batch_fail_count} failed)"
@@ -1449,24 +1972,25 @@ class YouTubeUploaderGUI:
         except Exception as e:
             self.log(f"Error in folder check: {str(e)}")
     
-    def _sleep_interruptible(self, seconds):
+    @property
+    def should_stop(self):
         """
-        Sleeps for the specified duration, but checks for stop signal periodically.
-        
-        This allows the worker thread to respond quickly to stop requests
-        even during long waits.
+        bool: True once the current watch run has been asked to stop.
         
-        Args:
-            seconds (float): Total seconds to sleep
+        Backed by stop_event. Assigning True sets the event; assigning False
+        starts a new run with a fresh event rather than clearing the old
+        one, so a cycle from a previous run (still finishing an upload
+        after Stop) keeps its stop signal and can't schedule further checks
+        alongside the new run.
         """
-        end_time = time.time() + seconds
-        
-        while time.time() < end_time:
-            if self.should_stop:
-                break
-            
-            # Sleep in small increments
-            time.sleep(config.SLEEP_INCREMENT_SECONDS)
+        return self.stop_event.is_set()
+    
+    @should_stop.setter
+    def should_stop(self, value):
+        if value:
+            self.stop_event.set()
+        else:
+            self.stop_event = threading.Event()
     
     # -------------------------------------------------------------------------
     # Window Management
@@ -1479,25 +2003,38 @@ class YouTubeUploaderGUI:
         Args:
             icon: System tray icon (unused, required by pystray callback signature)
         """
-        self.window_manager.restore_from_tray()
+        # Called on the tray icon's thread
+        self._run_on_ui(self.window_manager.restore_from_tray)
     
     def _quit_application(self):
         """
         Internal method to cleanly exit the application.
 
-        Can be called from any thread - uses root.after() to ensure
-        GUI operations happen on main thread.
+        Can be called from any thread - queues the shutdown so GUI
+        operations happen on main thread.
         """
         def do_quit():
             try:
-                # Signal worker thread to stop
+                # Signal a running check/upload cycle to stop
                 self.should_stop = True
 
+                # Hide the window now so waiting below doesn't look frozen
+                self.root.withdraw()
+
+                # Wait for a running check/upload cycle to stop (returns at
+                # once when none is running) - before anything it may still
+                # use is shut down
+                self._bg_idle.wait(timeout=config.GUI_QUIT_WAIT_SECONDS)
+
+                # Write any debounced state changes before exiting
+                self.state_manager.flush_pending_writes()
+                self.file_handler.flush_hash_cache()
+
                 # Hide and stop tray icon
                 self.system_tray_manager.stop()
 
-                # Give worker thread brief moment to stop
-                time.sleep(0.3)
+                # Release pooled network connections
+                self.auth_manager.close()
 
                 # Destroy GUI (must be on main thread)
                 self.root.quit()
@@ -1511,13 +2048,8 @@ class YouTubeUploaderGUI:
                 # Force exit if clean exit fails
                 sys.exit(1)
 
-        # If called from main thread, execute directly
-        # Otherwise, schedule on main thread
-        try:
-            self.root.after(0, do_quit)
-        except:
-            # If root is already destroyed or unavailable, force exit
-            sys.exit(0)
+        # Run on main thread with the other queued UI updates
+        self._run_on_ui(do_quit)
 
     def _on_quit_app(self, icon=None):
         """
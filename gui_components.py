@@ -4,86 +4,180 @@
 # Purpose: Provides reusable GUI widget creation utilities.
 #
 # Key Features:
-# - Tooltip creation with hover delay
+# - Tooltips with hover delay, from one delegated binding for all widgets
+# - Shared, decoded-once application icon
 # - Consistent widget styling
 # - Reduces code duplication in GUI setup
 # =============================================================================
 
+import os
 import tkinter as tk
 
 
-class TooltipHelper:
+# Decoded icons, keyed by (path, mtime_ns) so an edited icon file is reloaded
+# Holding the PhotoImage here also keeps Tk from garbage-collecting it
+_ICON_CACHE = {}
+
+
+def get_app_icon(icon_path):
+    """
+    Returns the icon at icon_path as a tk.PhotoImage, decoding it only once.
+
+    Every window that needs the app icon gets the same PhotoImage instead
+    of re-decoding the PNG through Tcl (and leaking a Tcl image each time).
+    A Tk root window must exist before calling this.
+
+    Args:
+        icon_path (str): Path to a PNG/GIF icon
+
+    Returns:
+        tk.PhotoImage: The decoded icon
+
+    Raises:
+        OSError: If the icon file cannot be stat'ed
+        tk.TclError: If the file cannot be decoded
+    """
+    key = (icon_path, os.stat(icon_path).st_mtime_ns)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = tk.PhotoImage(file=icon_path)
+        # Only the current version of a file is worth keeping
+        for stale_key in [k for k in _ICON_CACHE if k[0] == icon_path]:
+            del _ICON_CACHE[stale_key]
+        _ICON_CACHE[key] = icon
+    return icon
+
+
+class TooltipManager:
     """
-    Helper class for creating tooltips on widgets.
+    Shows tooltips for any number of widgets from one pair of bindings.
+
+    Instead of binding <Enter>/<Leave> (two Tcl callback commands plus
+    closures) on every widget, a single handler is bound on the "all" tag
+    and looks the hovered widget up in a { widget path: text } dict. One
+    tooltip window is created on first use and reused (hidden/shown) for
+    every tooltip afterwards.
 
     Tooltips appear after a short delay when hovering over widgets,
     and disappear when the mouse leaves.
+
+    Example:
+        >>> tooltips = TooltipManager(root)
+        >>> tooltips.add(button, "Click to start")
     """
 
-    @staticmethod
-    def create_tooltip(widget, text):
+    # Hover time before a tooltip appears (prevents flicker on quick hover)
+    SHOW_DELAY_MS = 300
+
+    __slots__ = (
+        'root', '_texts', '_window', '_label', '_label_text', '_visible',
+        '_scheduled_show', '_current_widget',
+    )
+
+    def __init__(self, root):
         """
-        Creates a tooltip for a widget.
+        Initialize the TooltipManager and install its bindings.
+
+        Args:
+            root (tk.Tk): Application root window
+        """
+        self.root = root
+        self._texts = {}
+        self._window = None
+        self._label = None
+        self._label_text = None
+        self._visible = False
+        self._scheduled_show = None
+        self._current_widget = None
+
+        # add='+' keeps any other "all" bindings intact
+        root.bind_all("<Enter>", self._on_enter, add='+')
+        root.bind_all("<Leave>", self._on_leave, add='+')
+
+    def add(self, widget, text):
+        """
+        Sets the tooltip text for a widget (replaces any previous text).
 
         Args:
             widget: The tkinter widget to attach the tooltip to
             text (str): The tooltip text to display
         """
-        tooltip_window = None
-        scheduled_show = None
-
-        def on_enter(event):
-            nonlocal tooltip_window, scheduled_show
-            # Cancel any previously scheduled tooltip
-            if scheduled_show is not None:
-                widget.after_cancel(scheduled_show)
-                scheduled_show = None
-
-            # Destroy any existing tooltip first
-            if tooltip_window is not None:
-                try:
-                    tooltip_window.destroy()
-                except:
-                    pass
-                tooltip_window = None
-
-            # Create new tooltip after short delay (prevents flicker on quick hover)
-            def show_tooltip():
-                nonlocal tooltip_window, scheduled_show
-                scheduled_show = None  # Clear the scheduled ID
-                if tooltip_window is None:  # Only create if not cancelled
-                    tooltip_window = tk.Toplevel()
-                    tooltip_window.wm_overrideredirect(True)
-                    tooltip_window.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-                    label = tk.Label(
-                        tooltip_window,
-                        text=text,
-                        background="#ffffe0",
-                        relief=tk.SOLID,
-                        borderwidth=1,
-                        font=("Arial", 9),
-                        padx=5,
-                        pady=3
-                    )
-                    label.pack()
-
-            # Delay tooltip creation slightly to avoid flicker
-            scheduled_show = widget.after(300, show_tooltip)
-
-        def on_leave(event):
-            nonlocal tooltip_window, scheduled_show
-            # Cancel scheduled tooltip if it hasn't shown yet
-            if scheduled_show is not None:
-                widget.after_cancel(scheduled_show)
-                scheduled_show = None
-
-            # Destroy existing tooltip if visible
-            if tooltip_window is not None:
-                try:
-                    tooltip_window.destroy()
-                except:
-                    pass
-                tooltip_window = None
-
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+        self._texts[str(widget)] = text
+
+    def _on_enter(self, event):
+        """
+        Schedules the hovered widget's tooltip, if it has one.
+        """
+        self._hide()
+        widget = str(event.widget)
+        if widget not in self._texts:
+            return
+
+        self._current_widget = widget
+        x, y = event.x_root + 10, event.y_root + 10
+        self._scheduled_show = self.root.after(
+            self.SHOW_DELAY_MS, self._show, widget, x, y
+        )
+
+    def _on_leave(self, event):
+        """
+        Hides the tooltip when the pointer leaves its widget.
+        """
+        if str(event.widget) == self._current_widget:
+            self._hide()
+
+    def _show(self, widget, x, y):
+        """
+        Displays the reusable tooltip window at (x, y).
+        """
+        self._scheduled_show = None
+        text = self._texts.get(widget)
+        if text is None:
+            return
+
+        try:
+            if self._window is None:
+                self._window = tk.Toplevel(self.root)
+                self._window.wm_overrideredirect(True)
+                self._label = tk.Label(
+                    self._window,
+                    background="#ffffe0",
+                    relief=tk.SOLID,
+                    borderwidth=1,
+                    font=("Arial", 9),
+                    padx=5,
+                    pady=3
+                )
+                self._label.pack()
+            # Re-hovering the same widget reuses the label as-is
+            if text is not self._label_text:
+                self._label.config(text=text)
+                self._label_text = text
+            self._window.wm_geometry(f"+{x}+{y}")
+            self._window.deiconify()
+            self._window.lift()
+            self._visible = True
+        except tk.TclError:
+            # Window is being destroyed
+            pass
+
+    def _hide(self):
+        """
+        Cancels any pending tooltip and hides the visible one.
+        """
+        self._current_widget = None
+        if self._scheduled_show is not None:
+            try:
+                self.root.after_cancel(self._scheduled_show)
+            except tk.TclError:
+                pass
+            self._scheduled_show = None
+
+        # <Enter> on any widget lands here, so skip the Tcl call unless
+        # a tooltip is actually showing
+        if self._visible:
+            self._visible = False
+            try:
+                self._window.withdraw()
+            except tk.TclError:
+                pass
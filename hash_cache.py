@@ -0,0 +1,197 @@
+# =============================================================================
+# hash_cache.py - YouTube Uploader v2.0 Persistent File Hash Cache
+# =============================================================================
+# Purpose: Remembers the full-file hash of every file we hash, so an
+#          unchanged file is never read and hashed twice - not within a
+#          session (watch folder re-scans) and not across restarts.
+#
+# How it works:
+# Entries are keyed by absolute path and remember the file's size and
+# modification time (st_mtime_ns) at the moment it was hashed. A lookup
+# only hits if both still match, so any rewrite of the file invalidates
+# its entry automatically.
+#
+# The cache is persisted to config.HASH_CACHE_FILE with the same atomic
+# temp-file-and-rename write used for the other state files. Writes are
+# debounced (state_writer.StateWriter) so hashing a batch of files costs a
+# single write. Losing or corrupting the cache is harmless - it only
+# means files get hashed again.
+# =============================================================================
+
+import os
+import tempfile
+import threading
+import config
+import json_io
+from state_writer import StateWriter
+
+
+class HashCache:
+    """
+    Persistent { path: (size, mtime_ns, algorithm, hash) } cache.
+
+    Thread-safe: the parallel pre-hash workers look up and record hashes
+    concurrently.
+
+    Example:
+        >>> cache = HashCache()
+        >>> st = os.stat("video.mp4")
+        >>> cache.get("video.mp4", st, "md5")  # None - not hashed yet
+        >>> cache.put("video.mp4", st, "md5", "d41d8cd98f00b204e9800998ecf8427e")
+        >>> cache.get("video.mp4", st, "md5")
+        'd41d8cd98f00b204e9800998ecf8427e'
+    """
+
+    def __init__(self, filepath=None, logger=None):
+        """
+        Initialize the HashCache. The file is loaded on first use.
+
+        Args:
+            filepath (str, optional): Cache file path.
+                                      Defaults to config.HASH_CACHE_FILE.
+            logger (callable, optional): Function to call for logging messages
+        """
+        self.filepath = filepath or config.HASH_CACHE_FILE
+        self.logger = logger
+        self._entries = None
+        self._lock = threading.Lock()
+        self._writer = StateWriter(self._write, config.STATE_WRITE_DEBOUNCE_SECONDS)
+
+    def _log(self, message):
+        """
+        Log a message if logger is configured.
+
+        Args:
+            message (str): Message to log
+        """
+        if self.logger:
+            self.logger(message)
+
+    @staticmethod
+    def _key(filepath):
+        """
+        Returns the cache key for a path (absolute, case-normalized on Windows).
+
+        Args:
+            filepath (str): Path to the file
+
+        Returns:
+            str: Cache key
+        """
+        return os.path.normcase(os.path.abspath(filepath))
+
+    def _load(self):
+        """
+        Returns the entries dict, loading it from disk on first call.
+
+        A missing or unreadable cache file starts an empty cache.
+        Must be called with self._lock held.
+
+        Returns:
+            dict: { key: [size, mtime_ns, algorithm, hash] }
+        """
+        if self._entries is None:
+            try:
+                with open(self.filepath, 'rb') as f:
+                    entries = json_io.loads(f.read())
+                if not isinstance(entries, dict):
+                    raise ValueError("hash cache is not a JSON object")
+                self._entries = entries
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                self._log(f"Ignoring unreadable hash cache: {str(e)}")
+                self._entries = {}
+        return self._entries
+
+    def get(self, filepath, file_stat, algorithm):
+        """
+        Looks up the cached hash of a file.
+
+        Args:
+            filepath (str): Path to the file
+            file_stat (os.stat_result): Current stat of the file
+            algorithm (str): Hash algorithm ('md5' or 'blake3')
+
+        Returns:
+            str: Cached hash, or None if the file isn't cached or has changed
+        """
+        with self._lock:
+            entry = self._load().get(self._key(filepath))
+        if (entry and len(entry) == 4 and
+                entry[0] == file_stat.st_size and
+                entry[1] == file_stat.st_mtime_ns and
+                entry[2] == algorithm):
+            return entry[3]
+        return None
+
+    def put(self, filepath, file_stat, algorithm, file_hash):
+        """
+        Records the hash of a file.
+
+        Only one hash per path is kept; the oldest entries are dropped once
+        config.HASH_CACHE_MAX_ENTRIES is exceeded.
+
+        Args:
+            filepath (str): Path to the file
+            file_stat (os.stat_result): Stat of the file taken BEFORE hashing
+            algorithm (str): Hash algorithm ('md5' or 'blake3')
+            file_hash (str): Hash as hexadecimal string
+        """
+        key = self._key(filepath)
+        with self._lock:
+            entries = self._load()
+            # Re-insert so dict order stays oldest -> newest
+            entries.pop(key, None)
+            entries[key] = [file_stat.st_size, file_stat.st_mtime_ns, algorithm, file_hash]
+            while len(entries) > config.HASH_CACHE_MAX_ENTRIES:
+                del entries[next(iter(entries))]
+        self._writer.schedule()
+
+    def discard(self, filepath):
+        """
+        Forgets a file (e.g. after it has been moved away).
+
+        Args:
+            filepath (str): Path to the file
+        """
+        with self._lock:
+            removed = self._load().pop(self._key(filepath), None)
+        if removed is not None:
+            self._writer.schedule()
+
+    def flush(self):
+        """
+        Writes any pending changes to disk immediately. Call before exiting.
+        """
+        self._writer.flush_if_pending()
+
+    def _write(self):
+        """
+        Atomically writes the cache file (temp file + rename).
+
+        Errors are logged, not raised, and the file isn't fsync'ed: the
+        cache is only an optimization, so losing it just means re-hashing.
+        """
+        with self._lock:
+            data = json_io.dumps_bytes(self._load())
+
+        directory = os.path.dirname(self.filepath) or '.'
+        temp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode='wb',
+                dir=directory,
+                delete=False,
+                suffix='.tmp'
+            ) as tmp_file:
+                temp_path = tmp_file.name
+                tmp_file.write(data)
+            os.replace(temp_path, self.filepath)
+        except OSError as e:
+            self._log(f"Could not write hash cache: {str(e)}")
+            try:
+                if temp_path and os.path.exists(temp_path):
+                    os.remove(temp_path)
+            except OSError:
+                pass
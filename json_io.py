@@ -0,0 +1,124 @@
+# =============================================================================
+# json_io.py - YouTube Uploader v2.0 JSON Serialization Helpers
+# =============================================================================
+# Purpose: Single place that turns state objects into JSON bytes and back.
+#
+# If the optional orjson package is installed it is used for both
+# directions (several times faster than the stdlib json module on large
+# upload_history.json files). Otherwise the stdlib json module is used.
+# Both paths produce the same 2-space indented, human-readable output.
+#
+# If msgspec is installed, upload_history.json is decoded against its
+# schema in a single C pass (parse + validation together).
+# =============================================================================
+
+import json
+from typing import Any, Dict, TypedDict
+
+# orjson is optional - a faster drop-in for state file I/O
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# msgspec is optional - schema-directed decoding of upload_history.json
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this one type regardless of which backend is active
+JSONDecodeError = json.JSONDecodeError
+
+
+class _UploadHistoryEntryRequired(TypedDict):
+    """Keys every upload_history.json entry must have."""
+    filename: Any
+    upload_date: Any
+    video_id: Any
+
+
+class UploadHistoryEntry(_UploadHistoryEntryRequired, total=False):
+    """
+    Schema of one upload_history.json entry.
+
+    Values are typed Any on purpose: the schema only enforces which keys
+    exist (like StateManager's validator), so an unexpected value type in
+    an old entry can never cause the whole history to be rejected.
+    """
+    hash_algo: Any
+    size: Any
+    head_sha256: Any
+
+
+if MSGSPEC_AVAILABLE:
+    _upload_history_decoder = msgspec.json.Decoder(Dict[str, UploadHistoryEntry])
+
+
+def loads(data):
+    """
+    Parses JSON from bytes or str.
+
+    Args:
+        data (bytes or str): Raw JSON document
+
+    Returns:
+        Parsed JSON object
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj):
+    """
+    Serializes an object to indented UTF-8 JSON bytes.
+
+    Args:
+        obj: JSON-serializable object (dict keys must be strings)
+
+    Returns:
+        bytes: JSON document, indented with 2 spaces
+
+    Example:
+        >>> dumps_bytes({"key": "value"})
+        b'{\\n  "key": "value"\\n}'
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def loads_upload_history(data):
+    """
+    Parses upload_history.json, validating its schema when msgspec is available.
+
+    With msgspec the document is decoded straight into the expected
+    { hash: entry } shape in C, so StateManager can skip its Python schema
+    check. Without msgspec this is the same as loads().
+
+    Args:
+        data (bytes or str): Raw JSON document
+
+    Returns:
+        dict: File hash -> entry dict
+
+    Raises:
+        JSONDecodeError: If data is not valid JSON
+        ValueError: If msgspec is available and an entry is missing keys
+    """
+    if not MSGSPEC_AVAILABLE:
+        return loads(data)
+
+    try:
+        return _upload_history_decoder.decode(data)
+    except msgspec.ValidationError as e:
+        raise ValueError(f"Schema validation failed: {e}")
+    except msgspec.DecodeError as e:
+        raise JSONDecodeError(str(e), data if isinstance(data, str) else '', 0)
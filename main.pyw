@@ -25,7 +25,7 @@ import config
 from auth_manager import AuthManager, AuthenticationError
 from file_handler import FileHandler
 from state_manager import StateManager
-from upload_manager import UploadManager, QuotaExceededError
+from upload_manager import UploadManager
 from gui import YouTubeUploaderGUI
 
 
@@ -161,7 +161,9 @@ class Application:
         # Initialize YouTube client (this may open browser for first-time auth)
         self._startup_log("Initializing YouTube client (may open browser)...")
         try:
-            self.auth_manager.initialize_youtube_client()
+            # Playlists are fetched by the GUI in the background, so the
+            # window doesn't wait for those round trips
+            self.auth_manager.initialize_youtube_client(fetch_playlists=False)
         except AuthenticationError as e:
             self._startup_log(f"Authentication failed: {str(e)}")
             messagebox.showerror(
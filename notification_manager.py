@@ -28,6 +28,9 @@ class NotificationManager:
     on Windows 10+, with proper error handling and graceful degradation.
     """
 
+    # No per-instance __dict__
+    __slots__ = ('log_callback', 'available')
+
     def __init__(self, log_callback=None):
         """
         Initialize the notification manager.
@@ -4,7 +4,7 @@
 # Purpose: Manages all JSON state files with atomic writes and validation.
 #
 # State Files Managed:
-# 1. upload_history.json - MD5 hashes of uploaded files (prevents re-uploads)
+# 1. upload_history.json - File hashes of uploaded files (prevents re-uploads)
 # 2. upload_state.json - Current state of files being processed (crash recovery)
 # 3. quota_state.json - Timestamp of last quota hit (24-hour cooldown)
 #
@@ -18,14 +18,14 @@
 # All writes use atomic operations to prevent corruption if the app crashes.
 # =============================================================================
 
-import json
 import os
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional
 import tempfile
 import shutil
 import config
+import json_io
+from state_writer import StateWriter
 
 
 class StateManagerError(Exception):
@@ -38,6 +38,87 @@ class StateManagerError(Exception):
     pass
 
 
+class HistoryIndex:
+    """
+    Secondary lookup structures derived from upload_history.
+    
+    Built once in a single pass when the history is loaded, then updated
+    incrementally as uploads are added, so duplicate pre-checks never have
+    to scan the whole history.
+    
+    Attributes:
+        sizes (set): File size of every fingerprinted entry
+        fingerprints (set): (size, head_sha256) of every fingerprinted entry
+        unhashed_fingerprints (set): (size, head_sha256) of entries recorded
+                                     without a full-file hash
+        has_unfingerprinted (bool): True if some entry has no fingerprint
+        has_legacy_md5 (bool): True if some entry is keyed by an MD5 hash
+    """
+    
+    def __init__(self, upload_history):
+        """
+        Build the index from the upload history.
+        
+        Args:
+            upload_history (dict): File hash -> video metadata
+        """
+        self.sizes = set()
+        self.fingerprints = set()
+        self.unhashed_fingerprints = set()
+        self.has_unfingerprinted = False
+        self.has_legacy_md5 = False
+        
+        for metadata in upload_history.values():
+            self.add(metadata)
+    
+    def add(self, metadata):
+        """
+        Adds one history entry to the index.
+        
+        Args:
+            metadata (dict): History entry (filename, video_id, hash_algo, ...)
+        """
+        size = metadata.get('size')
+        head_hash = metadata.get('head_sha256')
+        if size is None or head_hash is None:
+            self.has_unfingerprinted = True
+        else:
+            self.sizes.add(size)
+            self.fingerprints.add((size, head_hash))
+        
+        # Entries without hash_algo predate it and are always MD5;
+        # a null hash_algo marks an entry keyed by video ID (no full hash)
+        hash_algo = metadata.get('hash_algo', 'md5')
+        if hash_algo == 'md5':
+            self.has_legacy_md5 = True
+        elif hash_algo is None and size is not None and head_hash is not None:
+            self.unhashed_fingerprints.add((size, head_hash))
+    
+    def may_contain(self, fingerprint):
+        """
+        Returns False only if no entry can match the given fingerprint.
+        
+        Args:
+            fingerprint (tuple): (size, head_sha256)
+            
+        Returns:
+            bool: True if a matching entry might exist
+        """
+        return self.has_unfingerprinted or tuple(fingerprint) in self.fingerprints
+    
+    def may_contain_size(self, size):
+        """
+        Returns False only if no entry can have the given file size.
+        
+        Args:
+            size (int): File size in bytes
+            
+        Returns:
+            bool: True if an entry of that size might exist
+        """
+        return self.has_unfingerprinted or size in self.sizes
+
+
 class StateManager:
     """
     Manages all persistent state for the YouTube Uploader.
@@ -49,7 +130,7 @@ class StateManager:
     - Thread-safe operations
     
     Attributes:
-        upload_history (dict): MD5 hash -> video metadata
+        upload_history (dict): File hash -> video metadata
         upload_states (dict): filepath -> upload state (pending/uploading/etc)
         quota_state (dict): Contains 'last_quota_hit' timestamp
     """
@@ -65,11 +146,27 @@ class StateManager:
         self.logger = logger
         
         # In-memory state (loaded from files)
-        self.upload_history = {}  # { md5_hash: { filename, upload_date, video_id } }
+        self.upload_history = {}  # { file_hash: { filename, upload_date, video_id, hash_algo, size, head_sha256 } }
         self.upload_states = {}   # { filepath: { state, timestamp } }
         self.quota_state = {}     # { last_quota_hit: ISO timestamp }
         self.playlist_sort_state = {}  # { playlist_id, sorted_items, last_position }
 
+        # Secondary index of upload_history (see HistoryIndex)
+        # Built lazily on first use; None means "not built yet"
+        self._history_index = None
+
+        # upload_state.json writes are debounced (see set_upload_state)
+        self._upload_state_writer = StateWriter(
+            self._write_upload_states,
+            config.STATE_WRITE_DEBOUNCE_SECONDS
+        )
+
+        # user_preferences.json writes are debounced too (see set_preference)
+        self._preferences_writer = StateWriter(
+            self._write_preferences,
+            config.STATE_WRITE_DEBOUNCE_SECONDS
+        )
+
         # Load existing state from disk
         self._load_all_state()
     
@@ -116,13 +213,14 @@ class StateManager:
             # Create temporary file in same directory as target
             # (ensures same filesystem, making rename atomic)
             with tempfile.NamedTemporaryFile(
-                mode='w',
+                mode='wb',
                 dir=directory,
                 delete=False,
                 suffix='.tmp'
             ) as tmp_file:
                 # Write JSON with nice formatting for human readability
-                json.dump(data, tmp_file, indent=2)
+                # (json_io uses orjson when installed)
+                tmp_file.write(json_io.dumps_bytes(data))
                 temp_path = tmp_file.name
                 
                 # Force write to disk (don't rely on OS buffering)
@@ -151,7 +249,7 @@ class StateManager:
             self._log(error_msg)
             raise StateManagerError(error_msg)
     
-    def _load_json_with_validation(self, filepath, schema_validator=None):
+    def _load_json_with_validation(self, filepath, schema_validator=None, decoder=None):
         """
         Loads JSON from a file with optional schema validation.
         
@@ -162,6 +260,8 @@ class StateManager:
             filepath (str): Path to JSON file
             schema_validator (callable, optional): Function that validates the
                                                   loaded data structure
+            decoder (callable, optional): Function(bytes) -> object used to
+                                          parse the file (default: json_io.loads)
         
         Returns:
             dict: Loaded data, or empty dict if file doesn't exist or is invalid
@@ -177,8 +277,8 @@ class StateManager:
         
         try:
             # Load JSON from file
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                data = (decoder or json_io.loads)(f.read())
             
             # Validate schema if validator provided
             if schema_validator:
@@ -188,7 +288,7 @@ class StateManager:
             self._log(f"Successfully loaded {os.path.basename(filepath)}")
             return data
             
-        except json.JSONDecodeError as e:
+        except json_io.JSONDecodeError as e:
             # JSON is malformed - create backup and start fresh
             backup_path = f"{filepath}.corrupt.{int(time.time())}"
             self._log(f"WARNING: {filepath} is corrupted (JSON decode error)")
@@ -215,10 +315,12 @@ class StateManager:
         
         Expected schema:
         {
-            "md5_hash_string": {
+            "file_hash_string": {
                 "filename": "video.mp4",
                 "upload_date": "2025-10-22T14:30:00",
-                "video_id": "abc123xyz"
+                "video_id": "abc123xyz",
+                "hash_algo": "md5"       # Optional - missing means MD5, null
+                                         # means the key is "video:<video_id>"
             }
         }
         
@@ -431,10 +533,13 @@ class StateManager:
         it's backed up and we start with an empty state.
         """
         # Load upload history
+        # (with msgspec the decoder validates the schema during the parse)
         self.upload_history = self._load_json_with_validation(
             config.UPLOAD_HISTORY_FILE,
-            self._validate_upload_history_schema
+            None if json_io.MSGSPEC_AVAILABLE else self._validate_upload_history_schema,
+            decoder=json_io.loads_upload_history
         )
+        self._history_index = None
         
         # Load upload states
         self.upload_states = self._load_json_with_validation(
@@ -468,10 +573,10 @@ class StateManager:
     
     def is_file_uploaded(self, file_hash):
         """
-        Checks if a file has already been uploaded (by MD5 hash).
+        Checks if a file has already been uploaded (by file hash).
         
         Args:
-            file_hash (str): MD5 hash of the file
+            file_hash (str): Hash of the file
             
         Returns:
             bool: True if file was previously uploaded, False otherwise
@@ -483,26 +588,118 @@ class StateManager:
         """
         return file_hash in self.upload_history
     
-    def add_upload_to_history(self, file_hash, filename, video_id):
+    def has_legacy_md5_entries(self):
+        """
+        Checks if the history contains entries keyed by MD5 hashes.
+        
+        Entries written before hash_algo was recorded are always MD5. When
+        config.HASH_ALGORITHM is switched to something else, the uploader
+        uses this to decide whether an extra MD5 lookup is worthwhile.
+        
+        Returns:
+            bool: True if at least one MD5-keyed entry exists
+        """
+        return self._get_history_index().has_legacy_md5
+    
+    def may_be_uploaded(self, fingerprint):
+        """
+        Cheap pre-check using a file's quick fingerprint.
+        
+        Returns False only when the file is certainly NOT in the history,
+        so the caller can skip the full-file hash. Entries recorded before
+        fingerprints were stored can't be ruled out, so while any exist
+        this always returns True.
+        
+        Args:
+            fingerprint (tuple): (size, head_sha256) from
+                                 FileHandler.quick_fingerprint()
+            
+        Returns:
+            bool: True if the file might already be uploaded
+        """
+        return self._get_history_index().may_contain(fingerprint)
+    
+    def is_uploaded_unhashed(self, fingerprint):
+        """
+        Checks if a file was uploaded but recorded without a full-file hash.
+        
+        Such entries (see add_upload_to_history()) can only be matched by
+        quick fingerprint, since is_file_uploaded() needs the full hash.
+        
+        Args:
+            fingerprint (tuple): (size, head_sha256) from
+                                 FileHandler.quick_fingerprint()
+            
+        Returns:
+            bool: True if an unhashed entry has this fingerprint
+        """
+        return tuple(fingerprint) in self._get_history_index().unhashed_fingerprints
+    
+    def may_have_size(self, size):
+        """
+        Cheapest pre-check: can any uploaded file have this exact size?
+        
+        Like may_be_uploaded(), but needs only os.stat() - no file data is
+        read. A False result proves the file is new.
+        
+        Args:
+            size (int): File size in bytes
+            
+        Returns:
+            bool: True if the file might already be uploaded
+        """
+        return self._get_history_index().may_contain_size(size)
+    
+    def _get_history_index(self):
+        """
+        Returns the HistoryIndex, building it on first use.
+        
+        Returns:
+            HistoryIndex: Index over the current upload_history
+        """
+        if self._history_index is None:
+            self._history_index = HistoryIndex(self.upload_history)
+        return self._history_index
+    
+    def add_upload_to_history(self, file_hash, filename, video_id, hash_algo='md5',
+                              fingerprint=None):
         """
         Records a successful upload in the history.
         
         This prevents the same file from being uploaded again in the future.
         
+        If the file couldn't be hashed, pass file_hash=None: the entry is
+        then keyed by 'video:<video_id>' with a null hash_algo and matched
+        by its fingerprint alone (is_uploaded_unhashed()).
+        
         Args:
-            file_hash (str): MD5 hash of the uploaded file
+            file_hash (str): Hash of the uploaded file, or None
             filename (str): Original filename
             video_id (str): YouTube video ID returned by API
+            hash_algo (str): Algorithm that produced file_hash ('md5' or 'blake3')
+            fingerprint (tuple, optional): (size, head_sha256) quick fingerprint
             
         Example:
             >>> sm = StateManager()
             >>> sm.add_upload_to_history("abc123...", "video.mp4", "dQw4w9WgXcQ")
         """
-        self.upload_history[file_hash] = {
+        if file_hash is None:
+            file_hash = f"video:{video_id}"
+            hash_algo = None
+        
+        entry = {
             'filename': filename,
             'upload_date': datetime.now().isoformat(),
-            'video_id': video_id
+            'video_id': video_id,
+            'hash_algo': hash_algo
         }
+        if fingerprint:
+            entry['size'], entry['head_sha256'] = fingerprint
+        self.upload_history[file_hash] = entry
+        
+        # Keep the index in sync (if it has been built)
+        if self._history_index is not None:
+            self._history_index.add(entry)
         
         # Persist to disk immediately
         self._atomic_write_json(config.UPLOAD_HISTORY_FILE, self.upload_history)
@@ -556,10 +753,34 @@ class StateManager:
 
         self.upload_states[filepath] = state_info
 
-        # Persist to disk immediately (important for crash recovery)
-        self._atomic_write_json(config.UPLOAD_STATE_FILE, self.upload_states)
+        # 'uploading' is persisted immediately - crash recovery depends on it.
+        # Other transitions are coalesced into one write shortly afterwards
+        if state == 'uploading':
+            self._upload_state_writer.flush()
+        else:
+            self._upload_state_writer.schedule()
         self._log(f"Set upload state for {os.path.basename(filepath)}: {state}")
     
+    def _write_upload_states(self):
+        """
+        Writes a snapshot of upload_states to disk (StateWriter callback).
+        """
+        # Copy so the worker thread can keep updating states during the write
+        self._atomic_write_json(config.UPLOAD_STATE_FILE, dict(self.upload_states))
+    
+    def flush_pending_writes(self):
+        """
+        Writes any debounced state changes to disk immediately.
+        
+        Call this before the application exits.
+        """
+        for writer in (self._upload_state_writer, self._preferences_writer):
+            try:
+                writer.flush_if_pending()
+            except StateManagerError as e:
+                # Keep going so the other writer still gets flushed
+                self._log(f"Could not save state on exit: {str(e)}")
+    
     def get_upload_state(self, filepath):
         """
         Gets the current state of a file.
@@ -680,6 +901,45 @@ class StateManager:
 
         return True
 
+    def is_in_retry_backoff(self, filepath):
+        """
+        Checks if a failed upload is still waiting for its retry time.
+
+        Args:
+            filepath (str): Full path to the file
+
+        Returns:
+            bool: True if the file failed and its next_retry_time is in the future
+        """
+        state_info = self.upload_states.get(filepath)
+        if not state_info or state_info.get('state') != 'failed':
+            return False
+
+        next_retry_time = state_info.get('next_retry_time')
+        if not next_retry_time:
+            return False
+
+        try:
+            return datetime.now() < datetime.fromisoformat(next_retry_time)
+        except ValueError:
+            # If we can't parse the time, allow retry
+            return False
+
+    def has_exhausted_retries(self, filepath):
+        """
+        Checks if a failed upload has used up all its retry attempts.
+
+        Args:
+            filepath (str): Full path to the file
+
+        Returns:
+            bool: True if the file failed config.MAX_UPLOAD_RETRY_ATTEMPTS times
+        """
+        state_info = self.upload_states.get(filepath)
+        return (state_info is not None and
+                state_info.get('state') == 'failed' and
+                state_info.get('retry_count', 0) >= config.MAX_UPLOAD_RETRY_ATTEMPTS)
+
     def get_failed_uploads_for_retry(self):
         """
         Returns list of failed uploads that are ready to be retried.
@@ -918,6 +1178,10 @@ class StateManager:
         """
         Sets a user preference and saves to disk.
 
+        The write is deferred briefly (config.STATE_WRITE_DEBOUNCE_SECONDS)
+        so several settings changed in a row cost one write;
+        flush_pending_writes() forces it.
+
         Args:
             key (str): Preference key
             value: Preference value
@@ -927,9 +1191,33 @@ class StateManager:
             >>> sm.set_preference('last_watch_folder', 'C:/Videos/Gaming')
         """
         self.user_preferences[key] = value
-        self._atomic_write_json(config.USER_PREFERENCES_FILE, self.user_preferences)
+        self._preferences_writer.schedule()
         self._log(f"Saved preference: {key}")
 
+    def set_preferences(self, preferences):
+        """
+        Sets several user preferences with a single write to disk.
+
+        Use this instead of repeated set_preference() calls when one change
+        implies others (e.g. autonomous mode turning on auto-start).
+
+        Args:
+            preferences (dict): Preference key -> value
+
+        Example:
+            >>> sm = StateManager()
+            >>> sm.set_preferences({'autonomous_mode': True, 'start_minimized': True})
+        """
+        self.user_preferences.update(preferences)
+        self._preferences_writer.schedule()
+        self._log(f"Saved preferences: {', '.join(preferences)}")
+
+    def _write_preferences(self):
+        """
+        Writes a snapshot of user_preferences to disk (StateWriter callback).
+        """
+        self._atomic_write_json(config.USER_PREFERENCES_FILE, dict(self.user_preferences))
+
     def get_all_preferences(self):
         """
         Gets all user preferences with defaults applied.
@@ -0,0 +1,104 @@
+# =============================================================================
+# state_writer.py - YouTube Uploader v2.0 Debounced State Writes
+# =============================================================================
+# Purpose: Coalesces writes of frequently changing state files: bursts of
+#          changes inside a short window become a single write.
+# =============================================================================
+
+import threading
+
+
+class StateWriter:
+    """
+    Coalesces bursts of state changes into a single deferred write.
+
+    Callers mutate their in-memory state and call schedule(). The first
+    call starts a timer; further calls before it fires are absorbed, and
+    when it fires the write function runs once with the latest state.
+    flush() writes immediately (use it for critical states and on exit).
+
+    Example:
+        >>> writer = StateWriter(lambda: save(states), delay=0.5)
+        >>> states["a"] = "pending"; writer.schedule()
+        >>> states["b"] = "pending"; writer.schedule()  # same write
+        >>> writer.flush()  # on shutdown
+    """
+
+    def __init__(self, write_func, delay):
+        """
+        Initialize the StateWriter.
+
+        Args:
+            write_func (callable): Function() that persists the current state
+            delay (float): Seconds to wait before writing after a change
+        """
+        self._write_func = write_func
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._timer = None
+        # True while a change hasn't been written successfully yet
+        self._dirty = False
+
+    def schedule(self):
+        """
+        Requests a write within the debounce delay (no-op if one is pending).
+        """
+        with self._lock:
+            self._dirty = True
+            if self._timer is not None:
+                return
+            self._timer = threading.Timer(self._delay, self._on_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """
+        Cancels any pending deferred write and writes immediately.
+        """
+        with self._lock:
+            self._cancel_timer()
+            self._write()
+
+    def flush_if_pending(self):
+        """
+        Writes immediately only if a change hasn't been written yet.
+
+        This includes a deferred write that failed, so the exit flush
+        retries it.
+        """
+        with self._lock:
+            self._cancel_timer()
+            if self._dirty:
+                self._write()
+
+    def _cancel_timer(self):
+        """
+        Cancels the pending timer, if any. Must be called with self._lock held.
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _write(self):
+        """
+        Runs the write function and clears the dirty flag once it succeeds.
+        Must be called with self._lock held.
+        """
+        self._write_func()
+        self._dirty = False
+
+    def _on_timer(self):
+        """
+        Timer callback - performs the deferred write.
+        """
+        with self._lock:
+            if self._timer is None:
+                # flush() already wrote and cancelled us
+                return
+            self._timer = None
+            try:
+                self._write()
+            except Exception:
+                # write_func reports its own errors; the writer stays dirty,
+                # so flush_if_pending() or the next change retries
+                pass
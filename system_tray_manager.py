@@ -24,6 +24,14 @@ class SystemTrayManager:
     including the context menu and icon visibility.
     """
 
+    # No per-instance __dict__
+    __slots__ = (
+        'on_show_callback',
+        'on_quit_callback',
+        'log_callback',
+        'tray_icon',
+    )
+
     def __init__(self, on_show_callback, on_quit_callback, log_callback=None):
         """
         Initialize the system tray manager.
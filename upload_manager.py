@@ -12,7 +12,7 @@
 # - Crash recovery support
 #
 # Data Flow:
-# 1. Check if file already uploaded (via MD5 hash)
+# 1. Check if file already uploaded (via file hash)
 # 2. Mark file as 'uploading' in state
 # 3. Upload to YouTube API
 # 4. Add to playlist (if selected)
@@ -22,12 +22,14 @@
 # =============================================================================
 
 import os
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from googleapiclient.http import MediaFileUpload
 from googleapiclient.errors import HttpError
 import config
-from auth_manager import test_youtube_api_connection
+from auth_manager import test_youtube_api_connection, invalidate_connectivity_cache
 
 
 class UploadError(Exception):
@@ -49,6 +51,84 @@ class QuotaExceededError(Exception):
     pass
 
 
+class PrefetchingMediaFileUpload(MediaFileUpload):
+    """
+    MediaFileUpload that reads the next chunk while the current one uploads.
+    
+    The stock MediaFileUpload streams each chunk straight from disk into
+    the HTTP request, so disk reads and network sends take turns. This
+    subclass hands the client whole chunks via getbytes() and, as soon as
+    chunk N is handed over, starts reading chunk N+1 on a background
+    thread - the upload then takes roughly max(read time, send time)
+    instead of their sum. At most two chunks are held in memory.
+    
+    Only useful for chunked uploads (chunksize > 0).
+    """
+    
+    def __init__(self, filename, **kwargs):
+        """
+        Initialize the upload.
+        
+        Args:
+            filename (str): Path to the file to upload
+            **kwargs: Passed through to MediaFileUpload (chunksize, resumable, ...)
+        """
+        super().__init__(filename, **kwargs)
+        
+        # Single worker so every read of the shared file handle is serialized
+        self._reader = ThreadPoolExecutor(max_workers=1)
+        self._prefetch = None  # (begin, length, Future)
+    
+    def _read(self, begin, length):
+        """
+        Reads length bytes at offset begin (runs on the reader thread).
+        """
+        self._fd.seek(begin)
+        return self._fd.read(length)
+    
+    def has_stream(self):
+        """
+        Reports no stream, so the API client fetches chunks via getbytes().
+        """
+        return False
+    
+    def getbytes(self, begin, length):
+        """
+        Returns the requested chunk and starts prefetching the next one.
+        
+        Args:
+            begin (int): Offset from the beginning of the file
+            length (int): Number of bytes to read
+            
+        Returns:
+            bytes: Chunk data (shorter than length at end of file)
+        """
+        prefetch, self._prefetch = self._prefetch, None
+        if prefetch and prefetch[:2] == (begin, length):
+            data = prefetch[2].result()
+        else:
+            # First chunk, or the server acknowledged a different offset
+            # than expected (e.g. partial chunk) - read synchronously
+            data = self._reader.submit(self._read, begin, length).result()
+        
+        next_begin = begin + len(data)
+        if len(data) == length and next_begin < self._size:
+            self._prefetch = (
+                next_begin, length,
+                self._reader.submit(self._read, next_begin, length)
+            )
+        return data
+    
+    def close(self):
+        """
+        Stops the reader thread and closes the file handle.
+        """
+        self._prefetch = None
+        self._reader.shutdown(wait=True, cancel_futures=True)
+        if self._fd:
+            self._fd.close()
+
+
 class UploadManager:
     """
     Manages video uploads to YouTube with quota awareness.
@@ -86,6 +166,7 @@ class UploadManager:
         self.privacy_status = config.DEFAULT_PRIVACY_SETTING
         self.selected_playlist_id = None
         self.selected_category = config.DEFAULT_VIDEO_CATEGORY
+        self.selected_category_id = config.DEFAULT_VIDEO_CATEGORY_ID
 
         # Session statistics
         self.session_upload_count = 0
@@ -93,6 +174,14 @@ class UploadManager:
         # Client health tracking (uses config constants for maintainability)
         self.client_created_time = datetime.now()
         self.uploads_since_refresh = 0
+
+        # Hashes computed ahead of time by prehash_files()
+        # { filepath: (size, mtime_ns, file_hash) }
+        self._prehashed = {}
+
+        # Quick fingerprints computed by prehash_files()
+        # { filepath: (size, mtime_ns, fingerprint) }
+        self._prefingerprints = {}
     
     def _log(self, message):
         """
@@ -205,7 +294,8 @@ class UploadManager:
         if privacy_status not in config.PRIVACY_SETTINGS:
             raise ValueError(f"Invalid privacy status: {privacy_status}")
         
-        self.privacy_status = privacy_status
+        # Interned so it shares the config constant's string object
+        self.privacy_status = sys.intern(privacy_status)
         self._log(f"Privacy setting changed to: {privacy_status}")
     
     def set_playlist(self, playlist_id):
@@ -236,6 +326,7 @@ class UploadManager:
             raise ValueError(f"Invalid video category: {category_name}")
 
         self.selected_category = category_name
+        self.selected_category_id = config.VIDEO_CATEGORIES[category_name]
         self._log(f"Video category set to: {category_name}")
     
     # -------------------------------------------------------------------------
@@ -317,6 +408,103 @@ class UploadManager:
     # -------------------------------------------------------------------------
     # Video Upload (Core Functionality)
     # -------------------------------------------------------------------------
+
+    def filter_files_ready_for_upload(self, folder_path, filenames):
+        """
+        Removes files that are still waiting out a retry backoff, and files
+        that have failed too often to be retried automatically.
+        
+        A failed upload records when it may be retried (exponential backoff
+        from INITIAL_RETRY_DELAY_SECONDS up to MAX_RETRY_DELAY_SECONDS).
+        Instead of blocking the upload loop until then, such files are
+        skipped so new videos keep flowing; a later folder check picks them
+        up once their delay has passed. Files that reached
+        MAX_UPLOAD_RETRY_ATTEMPTS are left for the user (e.g. Upload File).
+        
+        Args:
+            folder_path (str): Folder containing the files
+            filenames (list): Filenames found in the folder
+            
+        Returns:
+            list: Filenames that can be uploaded now (same order)
+        """
+        in_backoff = self.state_manager.is_in_retry_backoff
+        exhausted = self.state_manager.has_exhausted_retries
+        ready = []
+        deferred = given_up = 0
+        for filename in filenames:
+            filepath = os.path.join(folder_path, filename)
+            if exhausted(filepath):
+                given_up += 1
+            elif in_backoff(filepath):
+                deferred += 1
+            else:
+                ready.append(filename)
+        
+        if deferred:
+            self._log(f"{deferred} failed video(s) waiting for retry delay - skipping for now")
+        if given_up:
+            self._log(f"{given_up} video(s) failed {config.MAX_UPLOAD_RETRY_ATTEMPTS} times - "
+                      f"skipping (upload manually to retry)")
+        return ready
+    
+    def prehash_files(self, filepaths, file_stats=None):
+        """
+        Hashes a batch of files in parallel before they are uploaded.
+        
+        upload_video() reuses these hashes and quick fingerprints instead
+        of reading each file again (files already proven new by their quick
+        fingerprint are left for upload_video() to hash after upload), as
+        long as the file's size and modification time haven't changed since
+        it was hashed (e.g. a file still being copied into the watch folder is
+        re-hashed at upload time).
+        
+        Args:
+            filepaths (list): Full paths of the files about to be uploaded
+            file_stats (dict, optional): { filepath: (size, mtime_ns) } from
+                                         the folder scan; files listed here
+                                         aren't stat'ed again
+        """
+        file_stats = file_stats or {}
+        
+        # Stat before hashing so any later write invalidates the entry.
+        # Files proven new are skipped - upload_video() hashes those after
+        # uploading them. The checks go from cheapest to most expensive:
+        # size (no read), then quick fingerprint (first 1MB), then full hash
+        candidates = {}
+        for filepath in filepaths:
+            file_stat = file_stats.get(filepath)
+            if file_stat is None:
+                try:
+                    st = os.stat(filepath)
+                except OSError:
+                    continue
+                file_stat = (st.st_size, st.st_mtime_ns)
+            if self.state_manager.may_have_size(file_stat[0]):
+                candidates[filepath] = file_stat
+        
+        fingerprints = self.file_handler.quick_fingerprints_parallel(list(candidates))
+        self._prefingerprints = {
+            filepath: (*candidates[filepath], fingerprint)
+            for filepath, fingerprint in fingerprints.items() if fingerprint
+        }
+        stats = {
+            filepath: file_stat for filepath, file_stat in candidates.items()
+            if not fingerprints[filepath] or
+               self.state_manager.may_be_uploaded(fingerprints[filepath])
+        }
+        
+        self._prehashed.clear()
+        if not stats:
+            return
+        
+        self._log(f"Computing hashes for {len(stats)} file(s)...")
+        hashes = self.file_handler.hash_files_parallel(list(stats))
+        for filepath, file_hash in hashes.items():
+            if file_hash is not None:
+                size, mtime_ns = stats[filepath]
+                self._prehashed[filepath] = (size, mtime_ns, file_hash)
+    
     
     def upload_video(self, filepath, progress_callback=None):
         """
@@ -325,7 +513,7 @@ class UploadManager:
         This is the core upload function that:
         1. Validates file exists
         2. Validates file size (<256GB)
-        3. Computes MD5 hash for duplicate detection
+        3. Computes file hash for duplicate detection
         4. Checks for duplicates
         5. Marks as 'uploading' in state
         6. Prepares upload metadata
@@ -361,7 +549,8 @@ class UploadManager:
                 return False, f"File not found: {filename}", None
 
             # Step 2: Validate file size (YouTube has 256GB limit)
-            file_size = os.path.getsize(filepath)
+            file_stat = os.stat(filepath)
+            file_size = file_stat.st_size
             if file_size > config.MAX_FILE_SIZE_BYTES:
                 size_formatted = config.format_file_size(file_size)
                 max_size_formatted = config.format_file_size(config.MAX_FILE_SIZE_BYTES)
@@ -371,18 +560,51 @@ class UploadManager:
 
             self._log(f"File size: {config.format_file_size(file_size)}")
 
-            # Step 3: Compute MD5 hash for duplicate detection
-            self._log(f"Computing hash for {filename}...")
-            file_hash = self.file_handler.compute_file_hash(filepath)
+            # Step 3: Compute file hash for duplicate detection
+            # A quick (size, first 1MB) fingerprint that matches no history
+            # entry proves the file is new, so the full hash can wait until
+            # after the upload. Otherwise hash now (reusing the pre-computed
+            # fingerprint and hash if the file is unchanged since)
+            hash_algo = self.file_handler.hash_algorithm
+            file_hash = None
+            prefingerprint = self._prefingerprints.pop(filepath, None)
+            if prefingerprint and prefingerprint[:2] == (file_size, file_stat.st_mtime_ns):
+                fingerprint = prefingerprint[2]
+            else:
+                fingerprint = self.file_handler.quick_fingerprint(filepath)
+            if fingerprint is None or self.state_manager.may_be_uploaded(fingerprint):
+                # Uploaded before, but recorded without a full hash
+                if fingerprint and self.state_manager.is_uploaded_unhashed(fingerprint):
+                    msg = config.INFO_ALREADY_UPLOADED.format(filename=filename)
+                    self._log(msg)
+                    return False, msg, None
+
+                prehashed = self._prehashed.pop(filepath, None)
+                if prehashed and prehashed[:2] == (file_size, file_stat.st_mtime_ns):
+                    file_hash = prehashed[2]
+                else:
+                    self._log(f"Computing hash for {filename}...")
+                    file_hash = self.file_handler.compute_file_hash(filepath)
             
-            if file_hash is None:
-                return False, f"Failed to compute hash for {filename}", None
+                if file_hash is None:
+                    return False, f"Failed to compute hash for {filename}", None
 
-            # Step 4: Check if already uploaded
-            if self.state_manager.is_file_uploaded(file_hash):
-                msg = config.INFO_ALREADY_UPLOADED.format(filename=filename)
-                self._log(msg)
-                return False, msg, None
+                # Step 4: Check if already uploaded
+                if self.state_manager.is_file_uploaded(file_hash):
+                    msg = config.INFO_ALREADY_UPLOADED.format(filename=filename)
+                    self._log(msg)
+                    return False, msg, None
+
+                # History written before switching away from MD5 is keyed by MD5,
+                # so re-hash small files with MD5 to catch those legacy entries
+                if (hash_algo != 'md5' and
+                        file_size <= config.LEGACY_HASH_MAX_FILE_SIZE and
+                        self.state_manager.has_legacy_md5_entries()):
+                    legacy_hash = self.file_handler.compute_file_hash(filepath, 'md5')
+                    if legacy_hash and self.state_manager.is_file_uploaded(legacy_hash):
+                        msg = config.INFO_ALREADY_UPLOADED.format(filename=filename)
+                        self._log(msg)
+                        return False, msg, None
 
             # Step 5: Mark as uploading (for crash recovery)
             self.state_manager.set_upload_state(filepath, 'uploading')
@@ -391,8 +613,8 @@ class UploadManager:
             # Title is the filename without extension
             video_title = os.path.splitext(filename)[0]
 
-            # Get category ID from category name
-            category_id = config.VIDEO_CATEGORIES.get(self.selected_category, '22')
+            # Category ID was resolved from the name when it was selected
+            category_id = self.selected_category_id
 
             body = {
                 'snippet': {
@@ -408,13 +630,23 @@ class UploadManager:
             
             # Step 7: Create media upload object
             # Use chunked uploads for files larger than 100MB for better reliability
-            # Smaller files upload in one chunk for simplicity
-            chunk_size = config.UPLOAD_CHUNK_SIZE if file_size > 100 * 1024 * 1024 else -1
-            media = MediaFileUpload(
-                filepath,
-                chunksize=chunk_size,
-                resumable=True
-            )
+            # Smaller files upload in one chunk for simplicity.
+            # Chunked uploads read the next chunk from disk while the current
+            # one is being sent
+            if file_size > 100 * 1024 * 1024:
+                chunk_size = config.UPLOAD_CHUNK_SIZE
+                media = PrefetchingMediaFileUpload(
+                    filepath,
+                    chunksize=chunk_size,
+                    resumable=True
+                )
+            else:
+                chunk_size = -1
+                media = MediaFileUpload(
+                    filepath,
+                    chunksize=chunk_size,
+                    resumable=True
+                )
 
             # Step 8: Execute upload
             self._log(f"Uploading {filename} to YouTube...")
@@ -459,8 +691,14 @@ class UploadManager:
             
             finally:
                 # Always close the file handle
-                if hasattr(media, '_fd') and media._fd:
+                had_open_file = bool(getattr(media, '_fd', None))
+                if isinstance(media, PrefetchingMediaFileUpload):
+                    # Also stops the prefetch reader thread
+                    media.close()
+                elif had_open_file:
                     media._fd.close()
+
+                if had_open_file:
                     # Give system time to release file handle
                     # Using configured initial delay instead of hard-coded 1 second
                     time.sleep(config.INITIAL_FILE_OPERATION_DELAY)
@@ -478,6 +716,18 @@ class UploadManager:
                     self.state_manager.set_upload_state(filepath, 'failed')
                     return False, error_msg, video_id
 
+            # Files that skipped the up-front hash (proven new by their
+            # fingerprint) are hashed now, largely from the OS file cache
+            # that the upload itself just warmed. This is the file's last
+            # full read, so its pages are released from the cache afterwards.
+            # If that fails the video is still on YouTube: it's recorded by
+            # fingerprint instead, so it is never uploaded again
+            if file_hash is None:
+                file_hash = self.file_handler.compute_file_hash(filepath, drop_cache=True)
+                if file_hash is None:
+                    self._log(f"Warning: Could not hash {filename} - "
+                              f"recording upload by quick fingerprint instead")
+
             # Step 10: Move file to Uploaded folder (safe move with verification)
             watch_folder = os.path.dirname(filepath)
             uploaded_folder = config.get_uploaded_folder_path(watch_folder)
@@ -496,7 +746,10 @@ class UploadManager:
                 self._log("File was uploaded but could not be moved. Original file remains.")
 
             # Step 11: Record in upload history
-            self.state_manager.add_upload_to_history(file_hash, filename, video_id)
+            # (file_hash is None if the post-upload hash failed)
+            self.state_manager.add_upload_to_history(
+                file_hash, filename, video_id, hash_algo, fingerprint
+            )
 
             # Step 12: Mark as completed
             self.state_manager.set_upload_state(filepath, 'completed')
@@ -532,6 +785,9 @@ class UploadManager:
 
             # Check if this is a transient network error (e.g., VPN IP change)
             is_transient = self._is_transient_network_error(e)
+            if is_transient:
+                # The network just failed us; don't trust a cached "online"
+                invalidate_connectivity_cache()
 
             if is_transient:
                 # For transient errors, use a short delay before immediate retry
@@ -991,8 +1247,11 @@ class UploadManager:
         }
 
         try:
-            # Get all video files in folder
-            video_files = self.file_handler.get_video_files(folder_path)
+            # Get all video files in folder (sizes and mtimes from the same scan)
+            video_entries = self.file_handler.get_video_entries(folder_path)
+            video_files = self.filter_files_ready_for_upload(
+                folder_path, [name for name, _, _ in video_entries]
+            )
             results['total_files'] = len(video_files)
 
             if not video_files:
@@ -1006,6 +1265,13 @@ class UploadManager:
 
             self._log(f"Found {len(video_files)} video(s) to upload")
             
+            # Hash the whole batch up front, in parallel
+            self.prehash_files(
+                [os.path.join(folder_path, f) for f in video_files],
+                {os.path.join(folder_path, name): (size, mtime_ns)
+                 for name, size, mtime_ns in video_entries}
+            )
+            
             # Process each file
             for i, filename in enumerate(video_files):
                 # Check if we should stop (user clicked stop button, etc.)
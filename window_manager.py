@@ -18,6 +18,9 @@ class WindowManager:
     restoring from tray, and managing window visibility states.
     """
 
+    # No per-instance __dict__
+    __slots__ = ('root', 'tray_manager', 'log_callback')
+
     def __init__(self, root, tray_manager=None, log_callback=None):
         """
         Initialize the window manager.
@@ -12,7 +12,6 @@
 # - Graceful degradation on non-Windows platforms
 # =============================================================================
 
-import sys
 import os
 import ctypes
 
@@ -40,6 +39,9 @@ class WindowsIntegration:
     shutdown handlers for graceful application termination.
     """
 
+    # No per-instance __dict__
+    __slots__ = ('log_callback', 'startup_available')
+
     def __init__(self, log_callback=None):
         """
         Initialize the Windows integration manager.